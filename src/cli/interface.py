@@ -2,6 +2,7 @@
 import re
 import sys
 import asyncio
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pathlib import Path
@@ -24,6 +25,49 @@ class CLIColors:
     UNDERLINE = '\033[4m'
 
 
+# Static banners are rendered once at import time and written with a single print
+_WELCOME_BANNER = "\n".join([
+    f"\n{CLIColors.HEADER}{CLIColors.BOLD}{'='*80}{CLIColors.ENDC}",
+    f"{CLIColors.HEADER}{CLIColors.BOLD}🏥 MEDICAL RECORD ANALYSIS SYSTEM v1.0{CLIColors.ENDC}",
+    f"{CLIColors.HEADER}{CLIColors.BOLD}{'='*80}{CLIColors.ENDC}",
+    f"\n{CLIColors.OKBLUE}This system provides comprehensive medical record analysis including:{CLIColors.ENDC}",
+    f"   • {CLIColors.OKGREEN}Medical condition identification and summarization{CLIColors.ENDC}",
+    f"   • {CLIColors.OKGREEN}Research correlation with current medical literature{CLIColors.ENDC}",
+    f"   • {CLIColors.OKGREEN}Clinical recommendations based on evidence{CLIColors.ENDC}",
+    f"   • {CLIColors.OKGREEN}HIPAA-compliant audit logging and data protection{CLIColors.ENDC}",
+    f"\n{CLIColors.WARNING}⚠️  Important: This system is for healthcare professional use only.{CLIColors.ENDC}",
+    f"{CLIColors.WARNING}   Results should be reviewed by qualified medical personnel.{CLIColors.ENDC}",
+])
+
+_GOODBYE_BANNER = "\n".join([
+    f"\n{CLIColors.OKBLUE}{'='*60}{CLIColors.ENDC}",
+    f"{CLIColors.BOLD}Thank you for using the Medical Record Analysis System!{CLIColors.ENDC}",
+    f"{CLIColors.OKBLUE}{'='*60}{CLIColors.ENDC}",
+    f"{CLIColors.OKCYAN}All analysis results have been securely stored and logged.{CLIColors.ENDC}",
+])
+
+_ERROR_SEPARATOR = f"{CLIColors.FAIL}{'='*60}{CLIColors.ENDC}"
+
+_ERROR_MESSAGE_TEMPLATE = (
+    f"\n{_ERROR_SEPARATOR}\n"
+    f"{CLIColors.FAIL}{CLIColors.BOLD}❌ {{error_type}}{CLIColors.ENDC}\n"
+    f"{_ERROR_SEPARATOR}\n"
+    "\n{user_message}\n"
+    f"\n{CLIColors.WARNING}Error ID: {{error_id}} (for support reference){CLIColors.ENDC}"
+    "{suggestions}\n"
+    f"\n{_ERROR_SEPARATOR}"
+)
+
+_SUGGESTIONS_HEADER = f"\n\n{CLIColors.BOLD}💡 Suggestions:{CLIColors.ENDC}"
+
+
+@lru_cache(maxsize=256)
+def _render_progress_bar(filled_width: int, width: int) -> str:
+    """Render a progress bar, reusing previously built bars of the same shape."""
+    filled_width = max(0, min(filled_width, width))
+    return "█" * filled_width + "░" * (width - filled_width)
+
+
 class ProgressDisplay:
     """Enhanced progress display with visual progress bar."""
     
@@ -39,7 +83,7 @@ class ProgressDisplay:
         
         # Create progress bar
         filled_width = int(self.width * percentage / 100)
-        bar = "█" * filled_width + "░" * (self.width - filled_width)
+        bar = _render_progress_bar(filled_width, self.width)
         
         # Display progress
         print(f"\r{CLIColors.OKCYAN}[{bar}] {percentage:5.1f}% - {step_name}{CLIColors.ENDC}", end="", flush=True)
@@ -51,6 +95,9 @@ class ProgressDisplay:
 class InputValidator:
     """Input validation utilities for CLI."""
     
+    _WHITESPACE_PATTERN = re.compile(r"\s+")
+    _MC_PREFIX_PATTERN = re.compile(r"(?:^|(?<= ))Mc([a-z])")
+    
     @staticmethod
     def validate_patient_name(name: str) -> tuple[bool, str]:
         """
@@ -101,25 +148,31 @@ class InputValidator:
             str: Normalized patient name
         """
         # Remove extra whitespace and normalize case
-        name = " ".join(name.strip().split())
+        name = InputValidator._WHITESPACE_PATTERN.sub(" ", name.strip())
+        
+        # Fast path for names of ASCII letters only, where title() matches the
+        # per-word rules except for the Mc prefix; anything else takes the rules below
+        if name.isascii() and name.replace(" ", "").isalpha():
+            name = name.title()
+            return InputValidator._MC_PREFIX_PATTERN.sub(lambda m: "Mc" + m.group(1).upper(), name)
         
         # Capitalize each word properly
-        parts = []
-        for part in name.split():
-            # Handle special cases like O'Connor, McDonald, Jean-Luc
-            if "'" in part:
-                subparts = part.split("'")
-                part = "'".join([subpart.capitalize() for subpart in subparts])
-            elif "-" in part:
-                subparts = part.split("-")
-                part = "-".join([subpart.capitalize() for subpart in subparts])
-            elif part.lower().startswith("mc") and len(part) > 2:
-                part = "Mc" + part[2:].capitalize()
-            else:
-                part = part.capitalize()
-            parts.append(part)
-        
-        return " ".join(parts)
+        return " ".join(InputValidator._capitalize_name_part(part) for part in name.split())
+    
+    @staticmethod
+    def _capitalize_name_part(part: str) -> str:
+        """Capitalize one word of a patient name."""
+        # Handle special cases like O'Connor, McDonald, Jean-Luc
+        if "'" in part:
+            subparts = part.split("'")
+            return "'".join([subpart.capitalize() for subpart in subparts])
+        elif "-" in part:
+            subparts = part.split("-")
+            return "-".join([subpart.capitalize() for subpart in subparts])
+        elif part.lower().startswith("mc") and len(part) > 2:
+            return "Mc" + part[2:].capitalize()
+        else:
+            return part.capitalize()
 
 
 class ResultsFormatter:
@@ -139,11 +192,12 @@ class ResultsFormatter:
             str: Formatted report string
         """
         output = []
+        separator = f"{CLIColors.OKGREEN}{'='*80}{CLIColors.ENDC}"
         
         # Header
-        output.append(f"\n{CLIColors.OKGREEN}{'='*80}{CLIColors.ENDC}")
+        output.append(f"\n{separator}")
         output.append(f"{CLIColors.BOLD}{CLIColors.HEADER}📋 MEDICAL RECORD ANALYSIS REPORT{CLIColors.ENDC}")
-        output.append(f"{CLIColors.OKGREEN}{'='*80}{CLIColors.ENDC}")
+        output.append(separator)
         
         # Basic Information
         output.append(f"\n{CLIColors.BOLD}📋 Report Information:{CLIColors.ENDC}")
@@ -181,11 +235,11 @@ class ResultsFormatter:
         # Medical History Summary
         if hasattr(report.medical_summary, 'summary_text') and report.medical_summary.summary_text:
             output.append(f"\n   {CLIColors.UNDERLINE}Medical History Summary:{CLIColors.ENDC}")
-            summary_lines = report.medical_summary.summary_text.split('\n')[:3]  # First 3 lines
-            for line in summary_lines:
+            all_summary_lines = report.medical_summary.summary_text.split('\n')
+            for line in all_summary_lines[:3]:  # First 3 lines
                 if line.strip():
                     output.append(f"   {line.strip()}")
-            if len(report.medical_summary.summary_text.split('\n')) > 3:
+            if len(all_summary_lines) > 3:
                 output.append(f"   ... (see full report for complete summary)")
         
         # Research Analysis
@@ -246,9 +300,9 @@ class ResultsFormatter:
         output.append(f"   Access: Available for future reference and comparison")
         
         # Footer
-        output.append(f"\n{CLIColors.OKGREEN}{'='*80}{CLIColors.ENDC}")
+        output.append(f"\n{separator}")
         output.append(f"{CLIColors.BOLD}Analysis completed successfully! Report saved for future reference.{CLIColors.ENDC}")
-        output.append(f"{CLIColors.OKGREEN}{'='*80}{CLIColors.ENDC}")
+        output.append(separator)
         
         return "\n".join(output)
     
@@ -266,28 +320,62 @@ class ResultsFormatter:
         Returns:
             str: Formatted error message
         """
-        output = []
-        
-        output.append(f"\n{CLIColors.FAIL}{'='*60}{CLIColors.ENDC}")
-        output.append(f"{CLIColors.FAIL}{CLIColors.BOLD}❌ {error_type}{CLIColors.ENDC}")
-        output.append(f"{CLIColors.FAIL}{'='*60}{CLIColors.ENDC}")
-        
-        output.append(f"\n{user_message}")
-        output.append(f"\n{CLIColors.WARNING}Error ID: {error_id} (for support reference){CLIColors.ENDC}")
-        
+        suggestions_block = ""
         if suggestions:
-            output.append(f"\n{CLIColors.BOLD}💡 Suggestions:{CLIColors.ENDC}")
-            for i, suggestion in enumerate(suggestions, 1):
-                output.append(f"   {i}. {suggestion}")
-        
-        output.append(f"\n{CLIColors.FAIL}{'='*60}{CLIColors.ENDC}")
-        
-        return "\n".join(output)
+            suggestions_block = _SUGGESTIONS_HEADER + "".join(
+                f"\n   {i}. {suggestion}" for i, suggestion in enumerate(suggestions, 1)
+            )
+        
+        return _ERROR_MESSAGE_TEMPLATE.format(
+            error_type=error_type,
+            user_message=user_message,
+            error_id=error_id,
+            suggestions=suggestions_block
+        )
 
 
 class EnhancedCLI:
     """Enhanced command-line interface for medical record analysis."""
     
+    _ERROR_SUGGESTIONS = {
+        "XML Parsing Error": (
+            "Verify the patient name is spelled correctly",
+            "Check that the patient exists in the medical records system",
+            "Ensure you have proper access permissions",
+            "Contact system administrator if the problem persists"
+        ),
+        "Research Correlation Error": (
+            "The medical analysis was completed successfully",
+            "Research correlation failed but core analysis is available",
+            "Check internet connectivity for research database access",
+            "Try running the analysis again in a few minutes"
+        ),
+        "Report Generation Error": (
+            "The analysis was completed but report generation failed",
+            "Check system resources and try again",
+            "Contact technical support with the error ID",
+            "Verify S3 storage permissions and connectivity"
+        ),
+        "S3 Storage Error": (
+            "The analysis was completed but storage failed",
+            "Check AWS credentials and S3 bucket permissions",
+            "Verify network connectivity to AWS services",
+            "The analysis results are still available in memory"
+        ),
+        "Workflow Error": (
+            "A system communication error occurred",
+            "Try restarting the analysis",
+            "Check system resources and network connectivity",
+            "Contact technical support if the problem persists"
+        )
+    }
+    
+    _DEFAULT_ERROR_SUGGESTIONS = (
+        "Try running the analysis again",
+        "Check system connectivity and resources",
+        "Contact technical support with the error ID"
+    )
+    
     def __init__(self):
         self.validator = InputValidator()
         self.formatter = ResultsFormatter()
@@ -295,18 +383,7 @@ class EnhancedCLI:
         
     def display_welcome(self):
         """Display welcome message and system information."""
-        print(f"\n{CLIColors.HEADER}{CLIColors.BOLD}{'='*80}{CLIColors.ENDC}")
-        print(f"{CLIColors.HEADER}{CLIColors.BOLD}🏥 MEDICAL RECORD ANALYSIS SYSTEM v1.0{CLIColors.ENDC}")
-        print(f"{CLIColors.HEADER}{CLIColors.BOLD}{'='*80}{CLIColors.ENDC}")
-        
-        print(f"\n{CLIColors.OKBLUE}This system provides comprehensive medical record analysis including:{CLIColors.ENDC}")
-        print(f"   • {CLIColors.OKGREEN}Medical condition identification and summarization{CLIColors.ENDC}")
-        print(f"   • {CLIColors.OKGREEN}Research correlation with current medical literature{CLIColors.ENDC}")
-        print(f"   • {CLIColors.OKGREEN}Clinical recommendations based on evidence{CLIColors.ENDC}")
-        print(f"   • {CLIColors.OKGREEN}HIPAA-compliant audit logging and data protection{CLIColors.ENDC}")
-        
-        print(f"\n{CLIColors.WARNING}⚠️  Important: This system is for healthcare professional use only.{CLIColors.ENDC}")
-        print(f"{CLIColors.WARNING}   Results should be reviewed by qualified medical personnel.{CLIColors.ENDC}")
+        print(_WELCOME_BANNER)
     
     def get_patient_name(self) -> Optional[str]:
         """
@@ -414,44 +491,7 @@ class EnhancedCLI:
     
     def _get_error_suggestions(self, error_type: str) -> List[str]:
         """Get default suggestions for common error types."""
-        suggestions_map = {
-            "XML Parsing Error": [
-                "Verify the patient name is spelled correctly",
-                "Check that the patient exists in the medical records system",
-                "Ensure you have proper access permissions",
-                "Contact system administrator if the problem persists"
-            ],
-            "Research Correlation Error": [
-                "The medical analysis was completed successfully",
-                "Research correlation failed but core analysis is available",
-                "Check internet connectivity for research database access",
-                "Try running the analysis again in a few minutes"
-            ],
-            "Report Generation Error": [
-                "The analysis was completed but report generation failed",
-                "Check system resources and try again",
-                "Contact technical support with the error ID",
-                "Verify S3 storage permissions and connectivity"
-            ],
-            "S3 Storage Error": [
-                "The analysis was completed but storage failed",
-                "Check AWS credentials and S3 bucket permissions",
-                "Verify network connectivity to AWS services",
-                "The analysis results are still available in memory"
-            ],
-            "Workflow Error": [
-                "A system communication error occurred",
-                "Try restarting the analysis",
-                "Check system resources and network connectivity",
-                "Contact technical support if the problem persists"
-            ]
-        }
-        
-        return suggestions_map.get(error_type, [
-            "Try running the analysis again",
-            "Check system connectivity and resources",
-            "Contact technical support with the error ID"
-        ])
+        return list(self._ERROR_SUGGESTIONS.get(error_type, self._DEFAULT_ERROR_SUGGESTIONS))
     
     def display_partial_success(self, message: str):
         """Display partial success message."""
@@ -475,10 +515,7 @@ class EnhancedCLI:
     
     def display_goodbye(self):
         """Display goodbye message."""
-        print(f"\n{CLIColors.OKBLUE}{'='*60}{CLIColors.ENDC}")
-        print(f"{CLIColors.BOLD}Thank you for using the Medical Record Analysis System!{CLIColors.ENDC}")
-        print(f"{CLIColors.OKBLUE}{'='*60}{CLIColors.ENDC}")
-        print(f"{CLIColors.OKCYAN}All analysis results have been securely stored and logged.{CLIColors.ENDC}")
+        print(_GOODBYE_BANNER)
     
     def display_bedrock_results(self, results: Dict[str, Any]):
         """Display Bedrock Claude AI analysis results with enhanced formatting."""
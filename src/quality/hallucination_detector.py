@@ -1,18 +1,31 @@
 """Hallucination detection and data validation system for medical record analysis."""
 import re
+import string
+import sys
+import time
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass
+from collections import Counter, defaultdict
 from enum import Enum
+from functools import lru_cache
 import json
 from datetime import datetime
 import difflib
+from bisect import bisect_right
 
 from ..models import PatientData, MedicalSummary, ResearchAnalysis
 from ..utils.audit_logger import AuditLogger
 
 logger = logging.getLogger(__name__)
 
+# Basic ICD-10 code format: letter, two digits, optional one- or two-digit extension
+_ICD10_FORMAT_PATTERN = re.compile(r"^[A-Z]\d{2}(\.\d{1,2})?$")
+
+# Patient name in source XML: name attribute, else element text (simplified)
+_SOURCE_PATIENT_NAME_ATTR_PATTERN = re.compile(r'<patient\b[^>]*?\bname\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_SOURCE_PATIENT_NAME_PATTERN = re.compile(r'<patient[^>]*name[^>]*>([^<]+)</patient>', re.IGNORECASE)
+
 class ValidationSeverity(Enum):
     """Validation issue severity levels."""
     INFO = "info"
@@ -29,7 +42,19 @@ class ValidationType(Enum):
     COMPLETENESS = "completeness"
     ACCURACY = "accuracy"
 
-@dataclass
+# Severity for each bucket between ascending confidence thresholds
+_SEVERITY_BUCKETS = (
+    ValidationSeverity.CRITICAL,
+    ValidationSeverity.ERROR,
+    ValidationSeverity.WARNING,
+    ValidationSeverity.INFO,
+)
+
+# Enum values resolved once; Enum.value is a descriptor lookup on every access
+_VALIDATION_TYPE_VALUES = {validation_type: validation_type.value for validation_type in ValidationType}
+_SEVERITY_VALUES = {severity: severity.value for severity in ValidationSeverity}
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a validation issue found during analysis."""
     issue_id: str
@@ -46,13 +71,15 @@ class ValidationIssue:
     def __post_init__(self):
         if self.suggestions is None:
             self.suggestions = []
+        # Field names repeat across issues and are used as grouping keys
+        self.field_name = sys.intern(self.field_name)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging and reporting."""
         return {
             "issue_id": self.issue_id,
-            "validation_type": self.validation_type.value,
-            "severity": self.severity.value,
+            "validation_type": _VALIDATION_TYPE_VALUES[self.validation_type],
+            "severity": _SEVERITY_VALUES[self.severity],
             "description": self.description,
             "field_name": self.field_name,
             "expected_value": self.expected_value,
@@ -62,6 +89,58 @@ class ValidationIssue:
             "suggestions": self.suggestions
         }
 
+# Punctuation removed during term normalization (hyphens are kept, e.g. "a-fib")
+_TERM_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation.replace("-", ""))
+
+# Substrings that mark an unknown condition name as medical-sounding
+_MEDICAL_KEYWORDS = ("syndrome", "disease", "disorder", "condition", "itis", "osis", "pathy", "emia")
+
+# Standard pharmaceutical name endings: ACE inhibitors, beta blockers, statins, PPIs, antibiotics
+_MEDICATION_SUFFIXES = ("pril", "olol", "statin", "zole", "mycin")
+
+def _normalize_term(term: str) -> str:
+    """Lowercase a term, drop punctuation and collapse whitespace."""
+    return " ".join(term.translate(_TERM_PUNCTUATION_TABLE).lower().split())
+
+def _name_similarity(source_name: str, extracted_name: str) -> float:
+    """
+    Token-set similarity between two names.
+    
+    Case, punctuation and word order are ignored. Names with the same tokens, or
+    where one name is fully covered by at least two tokens of the other
+    ("Smith, John" / "John A. Smith"), score 1.0; a lone first name or surname
+    is compared by ratio so it cannot pass as the full patient name.
+    """
+    source_tokens = set(_normalize_term(source_name).split())
+    extracted_tokens = set(_normalize_term(extracted_name).split())
+    shared_tokens = source_tokens & extracted_tokens
+    
+    if source_tokens and source_tokens == extracted_tokens:
+        return 1.0
+    if len(shared_tokens) >= 2 and shared_tokens in (source_tokens, extracted_tokens):
+        return 1.0
+    
+    common = " ".join(sorted(shared_tokens))
+    source_joined = f"{common} {' '.join(sorted(source_tokens - shared_tokens))}".strip()
+    extracted_joined = f"{common} {' '.join(sorted(extracted_tokens - shared_tokens))}".strip()
+    pairs = [(source_joined, extracted_joined)]
+    if len(shared_tokens) >= 2:
+        pairs.extend([(common, source_joined), (common, extracted_joined)])
+    return max(difflib.SequenceMatcher(None, a, b).ratio() for a, b in pairs)
+
+@lru_cache(maxsize=1)
+def _current_year_for_hour(hour_bucket: int) -> int:
+    """Calendar year, computed once per hour bucket."""
+    return datetime.now().year
+
+def _current_year() -> int:
+    """Current calendar year without a clock read per call (refreshed hourly)."""
+    return _current_year_for_hour(int(time.time()) // 3600)
+
+def _is_icd10_format(icd_code: str) -> bool:
+    """Check an upper-cased code against the basic ICD-10 format."""
+    return _ICD10_FORMAT_PATTERN.match(icd_code) is not None
+
 class MedicalTerminologyValidator:
     """Validates medical terminology against standard ontologies."""
     
@@ -115,6 +194,31 @@ class MedicalTerminologyValidator:
             "diabetes_medications": ["metformin", "insulin", "glipizide", "glyburide"],
             "proton_pump_inhibitors": ["omeprazole", "lansoprazole", "pantoprazole"]
         }
+        
+        # Lookup tables built once so validation does dictionary hits instead of list scans
+        self._term_variations: Dict[str, Tuple[str, ...]] = {
+            term.lower(): tuple(v.lower() for v in variations)
+            for term, variations in self.medical_terms.items()
+        }
+        self._variation_index: Dict[str, str] = {}
+        for standard_term, variations in self.medical_terms.items():
+            for variation in variations:
+                self._variation_index.setdefault(variation.lower(), standard_term)
+        # (standard_term, normalized candidate) pairs for fuzzy matching
+        self._fuzzy_candidates: Tuple[Tuple[str, str], ...] = tuple(
+            (standard_term, term.lower())
+            for standard_term, variations in self.medical_terms.items()
+            for term in [standard_term] + variations
+        )
+        self._known_medications: Set[str] = {
+            med.lower() for medications in self.medication_patterns.values() for med in medications
+        }
+        # (category label, medication, normalized medication) in pattern order for partial matches
+        self._medication_candidates: Tuple[Tuple[str, str, str], ...] = tuple(
+            (category.replace('_', ' '), med, med.lower())
+            for category, medications in self.medication_patterns.items()
+            for med in medications
+        )
     
     def validate_condition_terminology(self, condition_name: str) -> Tuple[bool, float, List[str]]:
         """
@@ -129,36 +233,38 @@ class MedicalTerminologyValidator:
         if not condition_name:
             return False, 0.0, ["Condition name cannot be empty"]
         
-        condition_lower = condition_name.lower().strip()
+        condition_lower = _normalize_term(condition_name)
         
         # Check exact matches in medical terms
         if condition_lower in self.medical_terms:
             return True, 1.0, []
         
         # Check if it's a variation of a known term
-        for standard_term, variations in self.medical_terms.items():
-            if condition_lower in [v.lower() for v in variations]:
-                return True, 0.9, [f"Consider using standard term: {standard_term}"]
+        standard_term = self._variation_index.get(condition_lower)
+        if standard_term is not None:
+            return True, 0.9, [f"Consider using standard term: {standard_term}"]
         
         # Check for partial matches
         partial_matches = []
-        for standard_term, variations in self.medical_terms.items():
-            all_terms = [standard_term] + variations
-            for term in all_terms:
-                similarity = difflib.SequenceMatcher(None, condition_lower, term.lower()).ratio()
-                if similarity > 0.7:
-                    partial_matches.append((standard_term, similarity))
+        matcher = difflib.SequenceMatcher(None, condition_lower)
+        for standard_term, term in self._fuzzy_candidates:
+            matcher.set_seq2(term)
+            # The quick ratios are upper bounds, so candidates below the cutoff
+            # are skipped without computing the full matching blocks
+            if matcher.real_quick_ratio() <= 0.7 or matcher.quick_ratio() <= 0.7:
+                continue
+            similarity = matcher.ratio()
+            if similarity > 0.7:
+                partial_matches.append((standard_term, similarity))
         
         if partial_matches:
-            # Sort by similarity score
-            partial_matches.sort(key=lambda x: x[1], reverse=True)
-            best_match = partial_matches[0]
+            # Highest similarity wins; ties keep dictionary order
+            best_match = max(partial_matches, key=lambda x: x[1])
             suggestions = [f"Did you mean: {best_match[0]}?"]
             return True, best_match[1], suggestions
         
         # Check if it contains medical-sounding terms
-        medical_keywords = ["syndrome", "disease", "disorder", "condition", "itis", "osis", "pathy", "emia"]
-        if any(keyword in condition_lower for keyword in medical_keywords):
+        if any(keyword in condition_lower for keyword in _MEDICAL_KEYWORDS):
             return True, 0.6, ["Medical terminology detected but not in standard dictionary"]
         
         return False, 0.0, ["Unknown medical condition - please verify terminology"]
@@ -173,33 +279,22 @@ class MedicalTerminologyValidator:
         Returns:
             Tuple[bool, float, List[str]]: (is_valid, confidence_score, suggestions)
         """
-        if not medication_name:
+        med_lower = _normalize_term(medication_name) if medication_name else ""
+        if not med_lower:
             return False, 0.0, ["Medication name cannot be empty"]
         
-        med_lower = medication_name.lower().strip()
-        
         # Check against known medication patterns
-        for category, medications in self.medication_patterns.items():
-            if med_lower in [med.lower() for med in medications]:
-                return True, 1.0, []
-            
-            # Check for partial matches
-            for med in medications:
-                if med_lower in med.lower() or med.lower() in med_lower:
-                    return True, 0.8, [f"Possible match in {category.replace('_', ' ')}: {med}"]
-        
-        # Check for common medication suffixes/prefixes
-        med_patterns = [
-            r".*pril$",  # ACE inhibitors
-            r".*olol$",  # Beta blockers
-            r".*statin$",  # Statins
-            r".*zole$",  # PPIs
-            r".*mycin$",  # Antibiotics
-        ]
-        
-        for pattern in med_patterns:
-            if re.match(pattern, med_lower):
-                return True, 0.7, ["Medication name follows standard pharmaceutical naming pattern"]
+        if med_lower in self._known_medications:
+            return True, 1.0, []
+        
+        # Check for partial matches
+        for category, med, known_lower in self._medication_candidates:
+            if med_lower in known_lower or known_lower in med_lower:
+                return True, 0.8, [f"Possible match in {category}: {med}"]
+        
+        # Check for common medication suffixes
+        if med_lower.endswith(_MEDICATION_SUFFIXES):
+            return True, 0.7, ["Medication name follows standard pharmaceutical naming pattern"]
         
         return False, 0.0, ["Unknown medication name - please verify"]
     
@@ -223,12 +318,16 @@ class MedicalTerminologyValidator:
             return True, self.icd10_codes[icd_upper], []
         
         # Check format (basic ICD-10 format validation)
-        icd_pattern = r"^[A-Z]\d{2}(\.\d{1,2})?$"
-        if re.match(icd_pattern, icd_upper):
+        if _is_icd10_format(icd_upper):
             return True, "Valid ICD-10 format", ["Code format is valid but not in local dictionary"]
         
         return False, "", ["Invalid ICD-10 code format"]
 
+@lru_cache(maxsize=1)
+def _shared_terminology_validator() -> MedicalTerminologyValidator:
+    """Terminology validator shared by all detectors (read-only after construction)."""
+    return MedicalTerminologyValidator()
+
 class HallucinationDetector:
     """Detects potential hallucinations in medical analysis results."""
     
@@ -240,7 +339,7 @@ class HallucinationDetector:
             audit_logger: Optional audit logger for compliance
         """
         self.audit_logger = audit_logger
-        self.terminology_validator = MedicalTerminologyValidator()
+        self.terminology_validator = _shared_terminology_validator()
         self.validation_issues: List[ValidationIssue] = []
         
         # Confidence thresholds
@@ -281,8 +380,8 @@ class HallucinationDetector:
             # Validate patient demographics
             issues.extend(self._validate_demographics(extracted_data, source_xml))
             
-            # Validate medical conditions
-            issues.extend(self._validate_conditions(extracted_data, source_xml))
+            # Validate medical conditions (the source is lowercased once for all lookups)
+            issues.extend(self._validate_conditions(extracted_data, source_xml, source_xml.lower()))
             
             # Validate medications
             issues.extend(self._validate_medications(extracted_data, source_xml))
@@ -310,14 +409,15 @@ class HallucinationDetector:
         issues = []
         
         # Extract patient name from source XML (simplified)
-        name_match = re.search(r'<patient[^>]*name[^>]*>([^<]+)</patient>', source_xml, re.IGNORECASE)
+        name_match = (_SOURCE_PATIENT_NAME_ATTR_PATTERN.search(source_xml)
+                      or _SOURCE_PATIENT_NAME_PATTERN.search(source_xml))
         source_name = name_match.group(1).strip() if name_match else None
         
         extracted_name = extracted_data.get('patient_data', {}).get('name')
         
         if source_name and extracted_name:
-            # Compare names (allowing for minor variations)
-            similarity = difflib.SequenceMatcher(None, source_name.lower(), extracted_name.lower()).ratio()
+            # Compare names (allowing for case, punctuation and word order variations)
+            similarity = _name_similarity(source_name, extracted_name)
             
             if similarity < 0.8:
                 issues.append(ValidationIssue(
@@ -335,11 +435,15 @@ class HallucinationDetector:
         return issues
     
     def _validate_conditions(self, extracted_data: Dict[str, Any], 
-                           source_xml: str) -> List[ValidationIssue]:
+                           source_xml: str,
+                           source_lower: Optional[str] = None) -> List[ValidationIssue]:
         """Validate medical conditions against source and terminology."""
         issues = []
         
         conditions = extracted_data.get('medical_summary', {}).get('key_conditions', [])
+        # Lowercase the source once rather than once per condition
+        if source_lower is None and conditions:
+            source_lower = source_xml.lower()
         
         for i, condition in enumerate(conditions):
             condition_name = condition.get('name') if isinstance(condition, dict) else str(condition)
@@ -362,7 +466,7 @@ class HallucinationDetector:
                 ))
             
             # Check if condition appears in source XML
-            if not self._condition_in_source(condition_name, source_xml):
+            if not self._condition_in_source(condition_name, source_xml, source_lower):
                 issues.append(ValidationIssue(
                     issue_id=f"VAL_{datetime.now().strftime('%Y%m%d_%H%M%S')}_SRC_{i:03d}",
                     validation_type=ValidationType.SOURCE_VERIFICATION,
@@ -416,7 +520,7 @@ class HallucinationDetector:
         if birth_date and age:
             try:
                 # Simple age validation (would need more sophisticated logic in production)
-                current_year = datetime.now().year
+                current_year = _current_year()
                 birth_year = int(birth_date.split('-')[0]) if '-' in birth_date else None
                 
                 if birth_year:
@@ -439,33 +543,27 @@ class HallucinationDetector:
         
         return issues
     
-    def _condition_in_source(self, condition_name: str, source_xml: str) -> bool:
-        """Check if condition appears in source XML."""
+    def _condition_in_source(self, condition_name: str, source_xml: str,
+                             source_lower: Optional[str] = None) -> bool:
+        """Check if condition appears in source XML (optionally pre-lowercased)."""
         condition_lower = condition_name.lower()
-        source_lower = source_xml.lower()
+        if source_lower is None:
+            source_lower = source_xml.lower()
         
         # Direct match
         if condition_lower in source_lower:
             return True
         
         # Check for variations
-        variations = self.terminology_validator.medical_terms.get(condition_lower, [])
-        for variation in variations:
-            if variation.lower() in source_lower:
-                return True
-        
-        return False
+        variations = self.terminology_validator._term_variations.get(condition_lower, ())
+        return any(variation in source_lower for variation in variations)
     
     def _determine_severity(self, confidence_score: float) -> ValidationSeverity:
         """Determine validation severity based on confidence score."""
-        if confidence_score < self.confidence_thresholds['critical']:
-            return ValidationSeverity.CRITICAL
-        elif confidence_score < self.confidence_thresholds['error']:
-            return ValidationSeverity.ERROR
-        elif confidence_score < self.confidence_thresholds['warning']:
-            return ValidationSeverity.WARNING
-        else:
-            return ValidationSeverity.INFO
+        # Read from the live thresholds so the bounds never drift from the warning check
+        thresholds = self.confidence_thresholds
+        bounds = (thresholds['critical'], thresholds['error'], thresholds['warning'])
+        return _SEVERITY_BUCKETS[bisect_right(bounds, confidence_score)]
     
     def validate_analysis_completeness(self, analysis_data: Dict[str, Any]) -> List[ValidationIssue]:
         """
@@ -538,36 +636,41 @@ class HallucinationDetector:
                 suggestions=["Verify research search functionality"]
             ))
         else:
+            # Clock reads and field lists are shared by every finding in the batch
+            now = datetime.now()
+            id_prefix = f"VAL_{now.strftime('%Y%m%d_%H%M%S')}_RES"
+            current_year = _current_year()
+            required_fields = ('title', 'authors', 'journal', 'publication_year')
+            
             # Validate individual research findings
             for i, finding in enumerate(findings):
-                if isinstance(finding, dict):
-                    # Check required fields
-                    required_fields = ['title', 'authors', 'journal', 'publication_year']
-                    for field in required_fields:
-                        if field not in finding or not finding[field]:
-                            issues.append(ValidationIssue(
-                                issue_id=f"VAL_{datetime.now().strftime('%Y%m%d_%H%M%S')}_RES_{i:03d}",
-                                validation_type=ValidationType.COMPLETENESS,
-                                severity=ValidationSeverity.INFO,
-                                description=f"Missing research field: {field}",
-                                field_name=f"research_findings[{i}].{field}",
-                                suggestions=[f"Ensure {field} is extracted from research source"]
-                            ))
-                    
-                    # Validate publication year
-                    pub_year = finding.get('publication_year')
-                    if pub_year:
-                        current_year = datetime.now().year
-                        if pub_year > current_year or pub_year < 1900:
-                            issues.append(ValidationIssue(
-                                issue_id=f"VAL_{datetime.now().strftime('%Y%m%d_%H%M%S')}_RES_YEAR_{i:03d}",
-                                validation_type=ValidationType.LOGICAL_COHERENCE,
-                                severity=ValidationSeverity.WARNING,
-                                description=f"Invalid publication year: {pub_year}",
-                                field_name=f"research_findings[{i}].publication_year",
-                                actual_value=str(pub_year),
-                                suggestions=["Verify publication year accuracy"]
-                            ))
+                if not isinstance(finding, dict):
+                    continue
+                
+                # Check required fields
+                for field in required_fields:
+                    if not finding.get(field):
+                        issues.append(ValidationIssue(
+                            issue_id=f"{id_prefix}_{i:03d}",
+                            validation_type=ValidationType.COMPLETENESS,
+                            severity=ValidationSeverity.INFO,
+                            description=f"Missing research field: {field}",
+                            field_name=f"research_findings[{i}].{field}",
+                            suggestions=[f"Ensure {field} is extracted from research source"]
+                        ))
+                
+                # Validate publication year
+                pub_year = finding.get('publication_year')
+                if pub_year and (pub_year > current_year or pub_year < 1900):
+                    issues.append(ValidationIssue(
+                        issue_id=f"{id_prefix}_YEAR_{i:03d}",
+                        validation_type=ValidationType.LOGICAL_COHERENCE,
+                        severity=ValidationSeverity.WARNING,
+                        description=f"Invalid publication year: {pub_year}",
+                        field_name=f"research_findings[{i}].publication_year",
+                        actual_value=str(pub_year),
+                        suggestions=["Verify publication year accuracy"]
+                    ))
         
         # Check analysis confidence
         confidence = research_analysis.analysis_confidence
@@ -604,26 +707,21 @@ class HallucinationDetector:
                 "recommendations": ["Analysis passed all validation checks"]
             }
         
-        # Categorize issues
-        issues_by_severity = {}
-        issues_by_type = {}
+        # Categorize issues in a single pass; both groupings share one dictionary per issue
+        issues_by_severity = defaultdict(list)
+        issues_by_type = defaultdict(list)
         
         for issue in issues:
-            # By severity
-            severity = issue.severity.value
-            if severity not in issues_by_severity:
-                issues_by_severity[severity] = []
-            issues_by_severity[severity].append(issue.to_dict())
-            
-            # By type
-            val_type = issue.validation_type.value
-            if val_type not in issues_by_type:
-                issues_by_type[val_type] = []
-            issues_by_type[val_type].append(issue.to_dict())
+            issue_dict = issue.to_dict()
+            issues_by_severity[issue_dict["severity"]].append(issue_dict)
+            issues_by_type[issue_dict["validation_type"]].append(issue_dict)
+        
+        issues_by_severity = dict(issues_by_severity)
+        issues_by_type = dict(issues_by_type)
         
         # Determine overall status
-        has_critical = any(issue.severity == ValidationSeverity.CRITICAL for issue in issues)
-        has_error = any(issue.severity == ValidationSeverity.ERROR for issue in issues)
+        has_critical = _SEVERITY_VALUES[ValidationSeverity.CRITICAL] in issues_by_severity
+        has_error = _SEVERITY_VALUES[ValidationSeverity.ERROR] in issues_by_severity
         
         if has_critical:
             status = "FAILED"
@@ -658,14 +756,14 @@ class HallucinationDetector:
     
     def get_validation_statistics(self) -> Dict[str, Any]:
         """Get validation statistics."""
+        severity_counts = Counter(issue.severity for issue in self.validation_issues)
+        type_counts = Counter(issue.validation_type for issue in self.validation_issues)
         return {
             "total_validations": len(self.validation_issues),
             "issues_by_severity": {
-                severity.value: len([i for i in self.validation_issues if i.severity == severity])
-                for severity in ValidationSeverity
+                value: severity_counts[severity] for severity, value in _SEVERITY_VALUES.items()
             },
             "issues_by_type": {
-                val_type.value: len([i for i in self.validation_issues if i.validation_type == val_type])
-                for val_type in ValidationType
+                value: type_counts[val_type] for val_type, value in _VALIDATION_TYPE_VALUES.items()
             }
-        }
\ No newline at end of file
+        }
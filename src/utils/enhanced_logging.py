@@ -2,18 +2,50 @@
 import logging
 import logging.handlers
 import json
+import os
+import sys
 import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
-from contextlib import contextmanager
-from dataclasses import dataclass, asdict
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from dataclasses import dataclass
 import threading
+import weakref
+import atexit
+import copy
+import heapq
+import itertools
+from collections import deque
 from queue import Queue
 import boto3
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to stdlib json
+    orjson = None
+
+if orjson is not None:
+    # Datetimes and dataclasses go through default=str so output matches stdlib json
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+def _dumps_log_data(log_data: Dict[str, Any]) -> str:
+    """Serialize structured log data to a JSON string."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(log_data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; stdlib json handles these
+            pass
+    return json.dumps(log_data, default=str, ensure_ascii=False)
+
+@dataclass(slots=True)
 class PerformanceMetric:
     """Performance metric data structure."""
     operation: str
@@ -23,6 +55,22 @@ class PerformanceMetric:
     duration_seconds: float
     success: bool
     patient_id: Optional[str] = None
+    additional_data: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for logging."""
+        # Built directly rather than with dataclasses.asdict, whose recursive
+        # deep copy dominated the cost of recording and reporting metrics
+        return {
+            "operation": self.operation,
+            "component": self.component,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_seconds": self.duration_seconds,
+            "success": self.success,
+            "patient_id": self.patient_id,
+            "additional_data": dict(self.additional_data) if self.additional_data is not None else None
+        }
 
 class S3LogHandler(logging.Handler):
     """Custom log handler that uploads logs to S3."""
@@ -79,30 +127,127 @@ class S3LogHandler(logging.Handler):
                 ContentType='application/json'
             )
             
-            self.log_buffer.clear()
-            
-        except ClientError:
+        except (ClientError, BotoCoreError):
             # Silently fail S3 uploads to avoid breaking the application
             pass
+        finally:
+            # A failed batch is dropped (the local log files still have it) so
+            # failures cannot grow a buffer that is re-serialized on every record
+            self.log_buffer.clear()
     
     def close(self):
         """Upload remaining logs when handler is closed."""
         self._upload_logs()
         super().close()
-    additional_data: Optional[Dict[str, Any]] = None
+
+# Listeners still running; drained at interpreter exit before logging shuts down
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
+# Longest wait for a listener to drain its queue when it is stopped (seconds)
+QUEUE_DRAIN_TIMEOUT = 5.0
+
+def _stop_queue_listener(listener: logging.handlers.QueueListener,
+                         timeout: Optional[float] = QUEUE_DRAIN_TIMEOUT):
+    """Drain and stop a queue listener if it is still running.
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging."""
-        return asdict(self)
+    Waits at most ``timeout`` seconds; records still queued after that are
+    abandoned with the listener's daemon thread rather than blocking the caller
+    (or interpreter exit) behind a slow handler.
+    """
+    # Same steps as QueueListener.stop(), with a bounded join; the thread is
+    # cleared first because stop() fails if called twice
+    thread = listener._thread
+    if thread is not None:
+        listener._thread = None
+        listener.enqueue_sentinel()
+        thread.join(timeout)
+    if listener in _queue_listeners:
+        _queue_listeners.remove(listener)
+
+@atexit.register
+def _stop_queue_listeners():
+    """Flush queued log records to their handlers at interpreter exit."""
+    for listener in list(_queue_listeners):
+        _stop_queue_listener(listener)
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a listener thread running in the same process.
+    
+    The stock QueueHandler pre-formats records and drops exc_info so they can
+    be pickled; records consumed in-process can keep their exception details
+    for the structured formatter.
+    """
+    
+    def __init__(self, queue: Queue, listener: Optional[logging.handlers.QueueListener] = None):
+        super().__init__(queue)
+        self.listener = listener
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message now so later mutation of args cannot change it."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
     
+    # Record attributes promoted to top-level fields, as (attribute, field name)
+    _CUSTOM_FIELDS = (
+        ('patient_id', 'patient_id'),
+        ('operation', 'operation'),
+        ('component', 'component'),
+        ('error_record', 'error_details'),
+        ('performance_data', 'performance'),
+    )
+    
+    # Record attributes that are never copied into the "extra" field
+    _RESERVED_ATTRS = frozenset([
+        'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+        'filename', 'module', 'lineno', 'funcName', 'created',
+        'msecs', 'relativeCreated', 'thread', 'threadName',
+        'processName', 'process', 'exc_info', 'exc_text',
+        'stack_info', 'getMessage', 'patient_id', 'operation',
+        'component', 'error_record', 'performance_data'
+    ])
+    
+    # (whole second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+    _timestamp_cache = (None, "")
+    
+    @classmethod
+    def _format_timestamp(cls, created: float) -> str:
+        """Format a record timestamp as local ISO 8601 with microseconds."""
+        second = int(created)
+        # Round like datetime.fromtimestamp, carrying a full second into the prefix
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond >= 1_000_000:
+            second += 1
+            microsecond -= 1_000_000
+        cached_second, prefix = cls._timestamp_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            cls._timestamp_cache = (second, prefix)
+        return f"{prefix}.{microsecond:06d}"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
+        # Handler levels and filters have already run by the time format() is
+        # called, but one formatter instance is shared by several file handlers;
+        # reuse the JSON built for this record by an earlier handler (the same
+        # way logging.Formatter caches exc_text on the record)
+        cached = record.__dict__.get('_structured_json')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        
+        formatted = _dumps_log_data(self._build_record(record))
+        record._structured_json = (self, formatted)
+        return formatted
+    
+    def _build_record(self, record: logging.LogRecord) -> Dict[str, Any]:
+        """Build the structured log data for a record without serializing it."""
         # Base log data
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -124,46 +269,93 @@ class StructuredFormatter(logging.Formatter):
         }
         
         # Add exception information if present
-        if record.exc_info:
+        exc_info = record.exc_info
+        if exc_info is True:
+            # Records built directly with exc_info=True refer to the exception being handled
+            exc_info = sys.exc_info()
+        if exc_info and exc_info[0] is not None:
+            # The traceback is rendered at most once per record: reuse the text
+            # cached by any handler that already formatted it (e.g. console)
+            if not record.exc_text:
+                record.exc_text = self.formatException(exc_info)
             log_data["exception"] = {
-                "type": record.exc_info[0].__name__,
-                "message": str(record.exc_info[1]),
-                "traceback": self.formatException(record.exc_info)
+                "type": exc_info[0].__name__,
+                "message": str(exc_info[1]),
+                "traceback": record.exc_text
             }
         
-        # Add custom fields from extra
-        if hasattr(record, 'patient_id'):
-            log_data["patient_id"] = record.patient_id
-        
-        if hasattr(record, 'operation'):
-            log_data["operation"] = record.operation
-        
-        if hasattr(record, 'component'):
-            log_data["component"] = record.component
-        
-        if hasattr(record, 'error_record'):
-            log_data["error_details"] = record.error_record
-        
-        if hasattr(record, 'performance_data'):
-            log_data["performance"] = record.performance_data
+        # Add custom fields from extra (plain dict lookups; hasattr raises and
+        # catches AttributeError for every missing field)
+        record_dict = record.__dict__
+        for attr_name, field_name in self._CUSTOM_FIELDS:
+            if attr_name in record_dict:
+                log_data[field_name] = record_dict[attr_name]
         
         # Add any other extra fields
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname', 
-                          'filename', 'module', 'lineno', 'funcName', 'created', 
-                          'msecs', 'relativeCreated', 'thread', 'threadName', 
-                          'processName', 'process', 'exc_info', 'exc_text', 
-                          'stack_info', 'getMessage', 'patient_id', 'operation', 
-                          'component', 'error_record', 'performance_data']:
-                if not key.startswith('_'):
-                    log_data["extra"] = log_data.get("extra", {})
-                    log_data["extra"][key] = value
-        
-        return json.dumps(log_data, default=str, ensure_ascii=False)
+        extra = {
+            key: value for key, value in record_dict.items()
+            if key not in self._RESERVED_ATTRS and not key.startswith('_')
+        }
+        if extra:
+            log_data["extra"] = extra
+        
+        return log_data
+
+# Components that get a dedicated "medical_analysis.<component>" logger
+COMPONENTS = (
+    'xml_parser', 'condition_extractor', 'medical_summarizer',
+    'research_searcher', 'relevance_ranker', 'research_correlation',
+    'report_generator', 's3_persister', 'workflow'
+)
+
+@lru_cache(maxsize=128)
+def _get_performance_logger(component: str) -> logging.Logger:
+    """Get the performance logger for a component (loggers are process-wide singletons)."""
+    return logging.getLogger(f"{component}.performance")
+
+class _StatsShard:
+    """Performance counters written by a single thread and summed on read."""
+    
+    __slots__ = ("successful", "failed", "total_duration", "by_component", "slowest", "pending")
+    
+    def __init__(self):
+        self.successful = 0
+        self.failed = 0
+        self.total_duration = 0.0
+        # component -> [count, total_duration, successful]
+        self.by_component: Dict[str, List[Any]] = {}
+        # Min-heap of (duration, sequence, metric) for this thread's slowest operations
+        self.slowest: List[tuple] = []
+        # Metrics recorded by this thread that are not yet in the shared deque
+        self.pending: List[PerformanceMetric] = []
+    
+    def merged(self, other: "_StatsShard", slowest_limit: int) -> "_StatsShard":
+        """Return a new shard holding the counters of this shard and ``other``."""
+        merged = _StatsShard()
+        merged.successful = self.successful + other.successful
+        merged.failed = self.failed + other.failed
+        merged.total_duration = self.total_duration + other.total_duration
+        merged.by_component = {component: list(totals) for component, totals in self.by_component.items()}
+        for component, (count, duration, succeeded) in list(other.by_component.items()):
+            totals = merged.by_component.setdefault(component, [0, 0.0, 0])
+            totals[0] += count
+            totals[1] += duration
+            totals[2] += succeeded
+        merged.slowest = heapq.nlargest(slowest_limit, self.slowest + other.slowest)
+        heapq.heapify(merged.slowest)
+        return merged
+
+class _ThreadExitSentinel:
+    """Object kept only in a thread's local storage, so it is freed when the thread exits."""
+    
+    __slots__ = ("__weakref__",)
 
 class PerformanceMonitor:
     """Performance monitoring and metrics collection."""
     
+    SLOWEST_OPERATIONS_LIMIT = 10
+    METRIC_FLUSH_SIZE = 32
+    
     def __init__(self, max_metrics: int = 10000):
         """
         Initialize performance monitor.
@@ -171,18 +363,84 @@ class PerformanceMonitor:
         Args:
             max_metrics: Maximum number of metrics to keep in memory
         """
-        self.metrics: List[PerformanceMetric] = []
+        # Bounded deque drops the oldest metric in O(1) once max_metrics is reached.
+        # Threads buffer metrics in their shard and move them here in batches.
+        self._metrics: deque[PerformanceMetric] = deque(maxlen=max_metrics)
         self.max_metrics = max_metrics
-        self._lock = threading.Lock()
-        
-        # Performance statistics
-        self.stats = {
-            "total_operations": 0,
-            "successful_operations": 0,
-            "failed_operations": 0,
-            "average_duration": 0.0,
-            "operations_by_component": {},
-            "slowest_operations": []
+        
+        # Each recording thread updates its own counter shard, so the hot path
+        # takes no lock. The registry is a copy-on-write (retired, live shards)
+        # pair: readers use the current pair without locking, and the lock is
+        # only taken to register, flush, fold or clear shards. When a thread
+        # exits its shard is queued in _exited_shards and folded into the
+        # retired totals on the next registration, so thread churn does not
+        # grow the registry.
+        self._local = threading.local()
+        self._registry: tuple[_StatsShard, tuple[_StatsShard, ...]] = (_StatsShard(), ())
+        self._exited_shards: deque[_StatsShard] = deque()
+        self._shards_lock = threading.Lock()
+        # Tie-breaker so heap entries never compare PerformanceMetric objects
+        self._sequence = itertools.count()
+    
+    @property
+    def metrics(self) -> deque:
+        """Snapshot of recorded metrics, including those still buffered by recording threads."""
+        with self._shards_lock:
+            snapshot = deque(self._metrics, maxlen=self.max_metrics)
+            for shard in self._registry[1]:
+                snapshot.extend(shard.pending[:])
+        return snapshot
+    
+    def _flush_pending(self, shard: _StatsShard):
+        """Move a shard's buffered metrics into the shared deque (lock held)."""
+        # Only the owning thread appends to pending, so removing the first
+        # count entries never drops a metric appended concurrently
+        count = len(shard.pending)
+        if count:
+            self._metrics.extend(shard.pending[:count])
+            del shard.pending[:count]
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Performance statistics aggregated across all recording threads."""
+        retired, live_shards = self._registry
+        shards = (retired,) + live_shards
+        
+        successful = sum(shard.successful for shard in shards)
+        failed = sum(shard.failed for shard in shards)
+        total_operations = successful + failed
+        total_duration = sum(shard.total_duration for shard in shards)
+        
+        component_totals: Dict[str, List[Any]] = {}
+        for shard in shards:
+            for component, (count, duration, succeeded) in list(shard.by_component.items()):
+                totals = component_totals.setdefault(component, [0, 0.0, 0])
+                totals[0] += count
+                totals[1] += duration
+                totals[2] += succeeded
+        
+        operations_by_component = {
+            component: {
+                "count": count,
+                "total_duration": duration,
+                "average_duration": duration / count,
+                "success_rate": succeeded / count
+            }
+            for component, (count, duration, succeeded) in component_totals.items()
+        }
+        
+        return {
+            "total_operations": total_operations,
+            "successful_operations": successful,
+            "failed_operations": failed,
+            "average_duration": total_duration / total_operations if total_operations else 0.0,
+            "operations_by_component": operations_by_component,
+            "slowest_operations": [
+                entry[2] for entry in heapq.nlargest(
+                    self.SLOWEST_OPERATIONS_LIMIT,
+                    itertools.chain.from_iterable(list(shard.slowest) for shard in shards)
+                )
+            ]
         }
     
     @contextmanager
@@ -190,21 +448,23 @@ class PerformanceMonitor:
                          patient_id: Optional[str] = None,
                          additional_data: Optional[Dict[str, Any]] = None):
         """Context manager for measuring operation performance."""
+        # Wall-clock time is only read once for the metric timestamps; the
+        # duration comes from the monotonic nanosecond counter
         start_time = time.time()
+        start_ns = time.perf_counter_ns()
         success = False
         
         try:
             yield
             success = True
         finally:
-            end_time = time.time()
-            duration = end_time - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             
             metric = PerformanceMetric(
                 operation=operation,
                 component=component,
                 start_time=start_time,
-                end_time=end_time,
+                end_time=start_time + duration,
                 duration_seconds=duration,
                 success=success,
                 patient_id=patient_id,
@@ -215,97 +475,105 @@ class PerformanceMonitor:
     
     def _record_metric(self, metric: PerformanceMetric):
         """Record performance metric."""
-        with self._lock:
-            self.metrics.append(metric)
-            
-            # Limit metrics in memory
-            if len(self.metrics) > self.max_metrics:
-                self.metrics = self.metrics[-self.max_metrics:]
-            
-            # Update statistics
-            self._update_statistics(metric)
-            
-            # Log performance data
-            logger = logging.getLogger(f"{metric.component}.performance")
-            logger.info(
-                f"Operation completed: {metric.operation}",
-                extra={
-                    "performance_data": metric.to_dict(),
-                    "operation": metric.operation,
-                    "component": metric.component,
-                    "patient_id": metric.patient_id
-                }
-            )
+        shard = self._get_shard()
+        shard.pending.append(metric)
+        if len(shard.pending) >= self.METRIC_FLUSH_SIZE:
+            with self._shards_lock:
+                self._flush_pending(shard)
+        
+        # Update statistics
+        self._update_statistics(metric, shard)
+        
+        # Log performance data
+        logger = _get_performance_logger(metric.component)
+        logger.info(
+            f"Operation completed: {metric.operation}",
+            extra={
+                "performance_data": metric.to_dict(),
+                "operation": metric.operation,
+                "component": metric.component,
+                "patient_id": metric.patient_id
+            }
+        )
     
-    def _update_statistics(self, metric: PerformanceMetric):
+    def _get_shard(self) -> _StatsShard:
+        """Get the statistics shard owned by the calling thread."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _StatsShard()
+            sentinel = _ThreadExitSentinel()
+            self._local.shard = shard
+            self._local.exit_sentinel = sentinel
+            # Runs when the thread's local storage is released; only queues the
+            # shard, since it may fire on any thread, including one holding the lock
+            weakref.finalize(sentinel, self._exited_shards.append, shard).atexit = False
+            with self._shards_lock:
+                self._fold_exited_shards()
+                retired, shards = self._registry
+                self._registry = (retired, shards + (shard,))
+        return shard
+    
+    def _fold_exited_shards(self):
+        """Fold the shards of exited threads into the retired totals (lock held)."""
+        if not self._exited_shards:
+            return
+        
+        retired, shards = self._registry
+        while self._exited_shards:
+            shard = self._exited_shards.popleft()
+            # Shards dropped by clear_metrics are no longer registered
+            if not any(live is shard for live in shards):
+                continue
+            self._flush_pending(shard)
+            retired = retired.merged(shard, self.SLOWEST_OPERATIONS_LIMIT)
+            shards = tuple(live for live in shards if live is not shard)
+        self._registry = (retired, shards)
+    
+    def _update_statistics(self, metric: PerformanceMetric, shard: Optional[_StatsShard] = None):
         """Update performance statistics."""
-        self.stats["total_operations"] += 1
+        if shard is None:
+            shard = self._get_shard()
         
         if metric.success:
-            self.stats["successful_operations"] += 1
+            shard.successful += 1
         else:
-            self.stats["failed_operations"] += 1
-        
-        # Update average duration
-        total_duration = sum(m.duration_seconds for m in self.metrics)
-        self.stats["average_duration"] = total_duration / len(self.metrics)
+            shard.failed += 1
+        shard.total_duration += metric.duration_seconds
         
         # Update component statistics
-        component = metric.component
-        if component not in self.stats["operations_by_component"]:
-            self.stats["operations_by_component"][component] = {
-                "count": 0,
-                "total_duration": 0.0,
-                "average_duration": 0.0,
-                "success_rate": 0.0
-            }
-        
-        comp_stats = self.stats["operations_by_component"][component]
-        comp_stats["count"] += 1
-        comp_stats["total_duration"] += metric.duration_seconds
-        comp_stats["average_duration"] = comp_stats["total_duration"] / comp_stats["count"]
-        
-        # Calculate success rate for component
-        component_metrics = [m for m in self.metrics if m.component == component]
-        successful = sum(1 for m in component_metrics if m.success)
-        comp_stats["success_rate"] = successful / len(component_metrics)
-        
-        # Update slowest operations
-        self.stats["slowest_operations"] = sorted(
-            self.metrics,
-            key=lambda x: x.duration_seconds,
-            reverse=True
-        )[:10]
+        comp_stats = shard.by_component.get(metric.component)
+        if comp_stats is None:
+            comp_stats = shard.by_component[metric.component] = [0, 0.0, 0]
+        comp_stats[0] += 1
+        comp_stats[1] += metric.duration_seconds
+        if metric.success:
+            comp_stats[2] += 1
+        
+        # Keep only the slowest operations seen by this thread
+        entry = (metric.duration_seconds, next(self._sequence), metric)
+        if len(shard.slowest) < self.SLOWEST_OPERATIONS_LIMIT:
+            heapq.heappush(shard.slowest, entry)
+        elif entry > shard.slowest[0]:
+            heapq.heapreplace(shard.slowest, entry)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get current performance statistics."""
-        with self._lock:
-            return {
-                **self.stats,
-                "slowest_operations": [m.to_dict() for m in self.stats["slowest_operations"]]
-            }
+        stats = self.stats
+        stats["slowest_operations"] = [m.to_dict() for m in stats["slowest_operations"]]
+        return stats
     
     def get_metrics_for_component(self, component: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent metrics for specific component."""
-        with self._lock:
-            component_metrics = [
-                m.to_dict() for m in self.metrics 
-                if m.component == component
-            ][-limit:]
-            return component_metrics
+        component_metrics = [m for m in list(self.metrics) if m.component == component]
+        return [m.to_dict() for m in component_metrics[-limit:]]
     
     def clear_metrics(self):
         """Clear all metrics (for testing or maintenance)."""
-        with self._lock:
-            self.metrics.clear()
-            self.stats = {
-                "total_operations": 0,
-                "successful_operations": 0,
-                "failed_operations": 0,
-                "average_duration": 0.0,
-                "operations_by_component": {},
-                "slowest_operations": []
-            }
+        with self._shards_lock:
+            self._metrics.clear()
+            self._registry = (_StatsShard(), ())
+            self._exited_shards.clear()
+            self._local = threading.local()
 
 class EnhancedLoggingSystem:
     """Enhanced logging system with structured logging and performance monitoring."""
@@ -345,7 +613,6 @@ class EnhancedLoggingSystem:
     
     def _can_create_log_directory(self) -> bool:
         """Check if we can create log directory (skip in restricted environments)."""
-        import os
         # Skip file logging in Lambda/Bedrock Agent environments
         if (os.environ.get('AWS_LAMBDA_FUNCTION_NAME') or 
             os.environ.get('AWS_EXECUTION_ENV', '').startswith('AWS_Lambda')):
@@ -366,6 +633,8 @@ class EnhancedLoggingSystem:
         root_logger = logging.getLogger()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+            if isinstance(handler, InProcessQueueHandler) and handler.listener:
+                _stop_queue_listener(handler.listener)
         
         # Set root logger level
         root_logger.setLevel(self.log_level)
@@ -391,15 +660,28 @@ class EnhancedLoggingSystem:
             console_handler.setFormatter(console_formatter)
         root_logger.addHandler(console_handler)
         
-        # File handlers (only if file logging is available)
+        # File handlers (only if file logging is available). They are driven by a
+        # background listener so callers only pay for a queue put, not for file
+        # writes, rotation checks or S3 uploads.
+        self.queue_listener = None
         if self.use_file_logging:
-            self._setup_file_handlers(formatter)
+            log_queue = Queue()
+            self.queue_listener = logging.handlers.QueueListener(
+                log_queue,
+                *self._setup_file_handlers(formatter),
+                respect_handler_level=True
+            )
+            self.queue_listener.start()
+            _queue_listeners.append(self.queue_listener)
+            root_logger.addHandler(InProcessQueueHandler(log_queue, self.queue_listener))
         
         # Setup specific loggers
         self._setup_component_loggers()
     
-    def _setup_file_handlers(self, formatter: logging.Formatter):
+    def _setup_file_handlers(self, formatter: logging.Formatter) -> List[logging.Handler]:
         """Setup file handlers for different log types."""
+        handlers = []
+        
         # Main application log
         main_handler = logging.handlers.RotatingFileHandler(
             self.log_dir / "medical_analysis.log",
@@ -408,7 +690,7 @@ class EnhancedLoggingSystem:
         )
         main_handler.setLevel(self.log_level)
         main_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(main_handler)
+        handlers.append(main_handler)
         
         # Error log
         error_handler = logging.handlers.RotatingFileHandler(
@@ -418,7 +700,7 @@ class EnhancedLoggingSystem:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        logging.getLogger().addHandler(error_handler)
+        handlers.append(error_handler)
         
         # Performance log
         if self.enable_performance_monitoring:
@@ -432,7 +714,7 @@ class EnhancedLoggingSystem:
             
             # Add filter to only log performance messages
             performance_handler.addFilter(lambda record: hasattr(record, 'performance_data'))
-            logging.getLogger().addHandler(performance_handler)
+            handlers.append(performance_handler)
         
         # Audit log (HIPAA compliance)
         audit_handler = logging.handlers.RotatingFileHandler(
@@ -445,7 +727,7 @@ class EnhancedLoggingSystem:
         
         # Add filter for audit messages
         audit_handler.addFilter(lambda record: 'audit' in record.name.lower())
-        logging.getLogger().addHandler(audit_handler)
+        handlers.append(audit_handler)
         
         # S3 log handler for cloud storage
         try:
@@ -455,28 +737,36 @@ class EnhancedLoggingSystem:
             )
             s3_handler.setLevel(logging.INFO)
             s3_handler.setFormatter(formatter)
-            logging.getLogger().addHandler(s3_handler)
+            handlers.append(s3_handler)
         except Exception:
             # S3 handler is optional - don't fail if it can't be created
             pass
+        
+        return handlers
     
     def _setup_component_loggers(self):
         """Setup loggers for specific components."""
-        components = [
-            'xml_parser', 'condition_extractor', 'medical_summarizer',
-            'research_searcher', 'relevance_ranker', 'research_correlation',
-            'report_generator', 's3_persister', 'workflow'
-        ]
+        # Cache logger objects so operation logging skips the logging manager lookup
+        self._component_loggers: Dict[str, logging.Logger] = {}
         
-        for component in components:
+        for component in COMPONENTS:
             logger = logging.getLogger(f"medical_analysis.{component}")
             logger.setLevel(self.log_level)
+            self._component_loggers[component] = logger
             
             # Performance logger for each component
             if self.enable_performance_monitoring:
                 perf_logger = logging.getLogger(f"medical_analysis.{component}.performance")
                 perf_logger.setLevel(logging.INFO)
     
+    def _get_component_logger(self, component: str) -> logging.Logger:
+        """Get the cached logger for a component, creating it on first use."""
+        logger = self._component_loggers.get(component)
+        if logger is None:
+            logger = logging.getLogger(f"medical_analysis.{component}")
+            self._component_loggers[component] = logger
+        return logger
+    
     def get_performance_monitor(self) -> Optional[PerformanceMonitor]:
         """Get performance monitor instance."""
         return getattr(self, 'performance_monitor', None)
@@ -485,7 +775,9 @@ class EnhancedLoggingSystem:
                            patient_id: Optional[str] = None,
                            additional_data: Optional[Dict[str, Any]] = None):
         """Log operation start."""
-        logger = logging.getLogger(f"medical_analysis.{component}")
+        logger = self._get_component_logger(component)
+        if not logger.isEnabledFor(logging.INFO):
+            return
         logger.info(
             f"Starting operation: {operation}",
             extra={
@@ -502,8 +794,10 @@ class EnhancedLoggingSystem:
                          patient_id: Optional[str] = None,
                          additional_data: Optional[Dict[str, Any]] = None):
         """Log operation end."""
-        logger = logging.getLogger(f"medical_analysis.{component}")
+        logger = self._get_component_logger(component)
         level = logging.INFO if success else logging.ERROR
+        if not logger.isEnabledFor(level):
+            return
         status = "completed successfully" if success else "failed"
         
         logger.log(
@@ -526,12 +820,19 @@ class EnhancedLoggingSystem:
             "performance_stats": {}
         }
         
-        # Get log file sizes
-        for log_file in self.log_dir.glob("*.log"):
-            stats["log_files"][log_file.name] = {
-                "size_bytes": log_file.stat().st_size,
-                "modified": datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
-            }
+        # Get log file sizes from a single directory scan with one stat per file
+        try:
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".log") and entry.is_file():
+                        file_stat = entry.stat()
+                        stats["log_files"][entry.name] = {
+                            "size_bytes": file_stat.st_size,
+                            "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
+                        }
+        except FileNotFoundError:
+            # File logging disabled and the directory was never created
+            pass
         
         # Get performance statistics
         if self.enable_performance_monitoring and hasattr(self, 'performance_monitor'):
@@ -566,11 +867,22 @@ def get_performance_monitor() -> Optional[PerformanceMonitor]:
         return _logging_system.get_performance_monitor()
     return None
 
-@contextmanager
+_NULL_OPERATION_CONTEXT = nullcontext()
+
 def log_operation(operation: str, component: str,
-                 patient_id: Optional[str] = None,
-                 additional_data: Optional[Dict[str, Any]] = None):
+                  patient_id: Optional[str] = None,
+                  additional_data: Optional[Dict[str, Any]] = None):
     """Context manager for logging operations with performance monitoring."""
+    if _logging_system is None:
+        # Nothing to log or measure, so skip the generator-based context manager
+        return _NULL_OPERATION_CONTEXT
+    return _log_operation(operation, component, patient_id, additional_data)
+
+@contextmanager
+def _log_operation(operation: str, component: str,
+                   patient_id: Optional[str] = None,
+                   additional_data: Optional[Dict[str, Any]] = None):
+    """Log and measure an operation through the global logging system."""
     if _logging_system:
         _logging_system.log_operation_start(operation, component, patient_id, additional_data)
         
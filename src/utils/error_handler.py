@@ -1,9 +1,14 @@
 """Comprehensive error handling system for medical record analysis."""
+import functools
 import logging
+import sys
 import traceback
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 from enum import Enum
+from collections import Counter, defaultdict, deque
+import itertools
 import json
 
 from .audit_logger import AuditLogger
@@ -15,6 +20,9 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Sequence numbers for error IDs; next() on itertools.count is atomic under the GIL
+_ERROR_ID_SEQUENCE = itertools.count()
+
 class ErrorSeverity(Enum):
     """Error severity levels."""
     LOW = "low"
@@ -35,37 +43,74 @@ class ErrorCategory(Enum):
 class ErrorContext:
     """Context information for error handling."""
     
+    __slots__ = ("operation", "patient_id", "component", "additional_data",
+                 "timestamp", "error_id", "_cached_dict")
+    
     def __init__(self, 
                  operation: str,
                  patient_id: Optional[str] = None,
                  component: Optional[str] = None,
                  additional_data: Optional[Dict[str, Any]] = None):
-        self.operation = operation
+        # Operation and component names come from a small fixed set, so share one copy of each
+        self.operation = sys.intern(operation) if isinstance(operation, str) else operation
         self.patient_id = patient_id
-        self.component = component
+        self.component = sys.intern(component) if isinstance(component, str) else component
         self.additional_data = additional_data or {}
         self.timestamp = datetime.now()
         self.error_id = self._generate_error_id()
+        self._cached_dict: Optional[Dict[str, Any]] = None
     
     def _generate_error_id(self) -> str:
         """Generate unique error ID."""
-        timestamp = self.timestamp.strftime("%Y%m%d_%H%M%S")
-        return f"ERR_{timestamp}_{hash(self.operation) % 10000:04d}"
+        ts = self.timestamp
+        # The process-wide sequence keeps IDs distinct within the same second
+        return (
+            f"ERR_{ts.year:04d}{ts.month:02d}{ts.day:02d}_"
+            f"{ts.hour:02d}{ts.minute:02d}{ts.second:02d}_{next(_ERROR_ID_SEQUENCE) % 10000:04d}"
+        )
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging."""
-        return {
-            "error_id": self.error_id,
-            "operation": self.operation,
-            "patient_id": self.patient_id,
-            "component": self.component,
-            "timestamp": self.timestamp.isoformat(),
-            "additional_data": self.additional_data
-        }
+        """Convert to dictionary for logging (built once; callers get their own copy)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "error_id": self.error_id,
+                "operation": self.operation,
+                "patient_id": self.patient_id,
+                "component": self.component,
+                "timestamp": self.timestamp.isoformat(),
+                "additional_data": self.additional_data
+            }
+        # Error records hand this dict to callbacks, so mutations must not reach the cache
+        return dict(self._cached_dict)
 
 class ErrorHandler:
     """Comprehensive error handling system."""
     
+    MAX_RECENT_ERRORS = 100
+    
+    # Class-level tables are read-only so handler instances never share mutable state.
+    # User-facing messages for known error types, keyed by exception class name
+    _USER_MESSAGES = MappingProxyType({
+        "XMLParsingError": "Unable to parse patient medical record. Please verify the patient name and try again.",
+        "DataValidationError": "Invalid data detected in medical record. Analysis may be incomplete.",
+        "ResearchError": "Unable to access medical research databases. Analysis will continue without research correlation.",
+        "ReportError": "Unable to generate analysis report. Please try again or contact support.",
+        "S3Error": "Unable to save analysis report. The analysis was completed but storage failed.",
+        "AgentCommunicationError": "System communication error occurred. Please try again.",
+        "HallucinationDetectedError": "Potential data integrity issue detected. Analysis has been halted for review.",
+        "ConnectionError": "Network connection error. Please check your connection and try again.",
+        "TimeoutError": "Operation timed out. Please try again or contact support if the problem persists.",
+        "PermissionError": "Access denied. Please check your permissions or contact an administrator."
+    })
+    
+    # Generic user-facing messages for errors without a specific message
+    _SEVERITY_MESSAGES = MappingProxyType({
+        ErrorSeverity.CRITICAL: "A critical system error occurred. Please contact support immediately.",
+        ErrorSeverity.HIGH: "A significant error occurred. The operation could not be completed.",
+        ErrorSeverity.MEDIUM: "An error occurred, but the operation may have partially completed.",
+        ErrorSeverity.LOW: "A minor issue was encountered. The operation should continue normally."
+    })
+    
     def __init__(self, audit_logger: Optional[AuditLogger] = None):
         """
         Initialize error handler.
@@ -74,12 +119,12 @@ class ErrorHandler:
             audit_logger: Optional audit logger for HIPAA compliance
         """
         self.audit_logger = audit_logger
-        self.error_callbacks: Dict[str, List[Callable]] = {}
+        self.error_callbacks: Dict[str, List[Callable]] = defaultdict(list)
         self.error_statistics = {
             "total_errors": 0,
-            "errors_by_category": {},
-            "errors_by_severity": {},
-            "recent_errors": []
+            "errors_by_category": Counter(),
+            "errors_by_severity": Counter(),
+            "recent_errors": deque(maxlen=self.MAX_RECENT_ERRORS)
         }
         
         # Error classification mapping
@@ -98,6 +143,8 @@ class ErrorHandler:
             KeyError: (ErrorCategory.DATA, ErrorSeverity.MEDIUM),
             FileNotFoundError: (ErrorCategory.SYSTEM, ErrorSeverity.MEDIUM)
         }
+        # Classifications resolved through the inheritance walk, keyed by error type
+        self._classification_cache: Dict[type, tuple[ErrorCategory, ErrorSeverity]] = {}
         
         logger.info("Error handler initialized")
     
@@ -117,23 +164,12 @@ class ErrorHandler:
             Dict[str, Any]: Error handling result with metadata
         """
         try:
-            # Classify error
+            # Classify error (always yields Enum instances)
             category, severity = self._classify_error(error)
-
-            # Defensive: ensure category/severity are Enum instances (they may sometimes be strings)
-            try:
-                if not isinstance(category, ErrorCategory):
-                    category = ErrorCategory(category)
-                if not isinstance(severity, ErrorSeverity):
-                    severity = ErrorSeverity(severity)
-            except Exception:
-                logger.warning("Error classification returned unexpected types; falling back to SYSTEM/HIGH")
-                category = ErrorCategory.SYSTEM
-                severity = ErrorSeverity.HIGH
             
-            # Create error record (use safe conversions for category/severity)
-            category_value = category.value if isinstance(category, ErrorCategory) else str(category)
-            severity_value = severity.value if isinstance(severity, ErrorSeverity) else str(severity)
+            # Create error record
+            category_value = category.value
+            severity_value = severity.value
 
             error_record = {
                 "error_id": context.error_id,
@@ -155,18 +191,7 @@ class ErrorHandler:
             
             # Audit log for HIPAA compliance
             if self.audit_logger and context.patient_id:
-                self.audit_logger.log_error(
-                    operation=context.operation,
-                    component=context.component or "error_handler",
-                    error=error,
-                    patient_id=context.patient_id,
-                    additional_context={
-                        "error_id": context.error_id,
-                        "category": category_value,
-                        "severity": severity_value,
-                        "recovery_action": recovery_action
-                    }
-                )
+                self._audit_error(error, context, category_value, severity_value, recovery_action)
             
             # Execute error callbacks
             self._execute_error_callbacks(error_record)
@@ -177,8 +202,8 @@ class ErrorHandler:
             return {
                 "error_id": context.error_id,
                 "handled": True,
-                "severity": severity_value if isinstance(severity_value, str) else severity_value,
-                "category": category_value if isinstance(category_value, str) else category_value,
+                "severity": severity_value,
+                "category": category_value,
                 "is_recoverable": is_recoverable,
                 "recovery_action": recovery_action,
                 "user_message": self._generate_user_message(error, severity, category)
@@ -203,26 +228,65 @@ class ErrorHandler:
         # Check exact type match first
         if error_type in self.error_classification:
             category, severity = self.error_classification[error_type]
-            # If mapping contains raw values (e.g., strings), log them for diagnostics
-            if not isinstance(category, ErrorCategory) or not isinstance(severity, ErrorSeverity):
-                logger.warning(
-                    "Raw classification types detected: category=%r (%s), severity=%r (%s)",
-                    category, type(category), severity, type(severity)
-                )
-            return category, severity
+            return self._coerce_classification(error_type, category, severity)
 
-        # Check inheritance hierarchy
+        cached = self._classification_cache.get(error_type)
+        if cached is not None:
+            return cached
+
+        # Check inheritance hierarchy, falling back to the default for unknown errors
+        classification = (ErrorCategory.SYSTEM, ErrorSeverity.HIGH)
         for error_class, (category, severity) in self.error_classification.items():
             if isinstance(error, error_class):
-                if not isinstance(category, ErrorCategory) or not isinstance(severity, ErrorSeverity):
-                    logger.warning(
-                        "Raw classification types detected (inherited match): category=%r (%s), severity=%r (%s)",
-                        category, type(category), severity, type(severity)
-                    )
-                return category, severity
+                classification = self._coerce_classification(error_class, category, severity)
+                break
 
-        # Default classification for unknown errors
-        return ErrorCategory.SYSTEM, ErrorSeverity.HIGH
+        self._classification_cache[error_type] = classification
+        return classification
+    
+    def _coerce_classification(self, error_class: type, category: Any,
+                               severity: Any) -> tuple[ErrorCategory, ErrorSeverity]:
+        """
+        Ensure a classification entry holds Enum instances.
+        
+        Raw values (e.g. strings) are logged and coerced once, and the coerced
+        tuple is written back to the mapping so later errors of the same type
+        skip both the conversion and the warning.
+        """
+        if isinstance(category, ErrorCategory) and isinstance(severity, ErrorSeverity):
+            return category, severity
+        
+        logger.warning(
+            "Raw classification types detected for %s: category=%r (%s), severity=%r (%s)",
+            error_class.__name__, category, type(category), severity, type(severity)
+        )
+        try:
+            coerced = (ErrorCategory(category), ErrorSeverity(severity))
+        except ValueError:
+            logger.warning("Error classification returned unexpected types; falling back to SYSTEM/HIGH")
+            coerced = (ErrorCategory.SYSTEM, ErrorSeverity.HIGH)
+        
+        self.error_classification[error_class] = coerced
+        return coerced
+    
+    def _audit_error(self, error: Exception, context: ErrorContext, category_value: str,
+                     severity_value: str, recovery_action: Optional[str]):
+        """Write the audit entry for a handled error; audit failures do not abort handling."""
+        try:
+            self.audit_logger.log_error(
+                operation=context.operation,
+                component=context.component or "error_handler",
+                error=error,
+                patient_id=context.patient_id,
+                additional_context={
+                    "error_id": context.error_id,
+                    "category": category_value,
+                    "severity": severity_value,
+                    "recovery_action": recovery_action
+                }
+            )
+        except Exception as audit_error:
+            logger.error(f"Audit logging failed for {context.error_id}: {str(audit_error)}")
     
     def _log_error(self, error_record: Dict[str, Any], severity: ErrorSeverity):
         """Log error with appropriate level."""
@@ -248,18 +312,14 @@ class ErrorHandler:
         self.error_statistics["total_errors"] += 1
 
         # Update category statistics
-        cat_key = category.value if isinstance(category, ErrorCategory) else str(category)
-        if cat_key not in self.error_statistics["errors_by_category"]:
-            self.error_statistics["errors_by_category"][cat_key] = 0
+        cat_key = category.value
         self.error_statistics["errors_by_category"][cat_key] += 1
 
         # Update severity statistics
-        sev_key = severity.value if isinstance(severity, ErrorSeverity) else str(severity)
-        if sev_key not in self.error_statistics["errors_by_severity"]:
-            self.error_statistics["errors_by_severity"][sev_key] = 0
+        sev_key = severity.value
         self.error_statistics["errors_by_severity"][sev_key] += 1
         
-        # Keep recent errors (last 100)
+        # Keep recent errors (the bounded deque drops the oldest entries)
         self.error_statistics["recent_errors"].append({
             "error_id": error_record["error_id"],
             "error_type": error_record["error_type"],
@@ -267,30 +327,25 @@ class ErrorHandler:
             "severity": sev_key,
             "timestamp": error_record["timestamp"]
         })
-        
-        # Limit recent errors list
-        if len(self.error_statistics["recent_errors"]) > 100:
-            self.error_statistics["recent_errors"] = self.error_statistics["recent_errors"][-100:]
     
     def _execute_error_callbacks(self, error_record: Dict[str, Any]):
         """Execute registered error callbacks."""
-        error_type = error_record["error_type"]
+        if not self.error_callbacks:
+            return
         
         # Execute type-specific callbacks
-        if error_type in self.error_callbacks:
-            for callback in self.error_callbacks[error_type]:
-                try:
-                    callback(error_record)
-                except Exception as callback_error:
-                    logger.warning(f"Error callback failed: {str(callback_error)}")
+        for callback in self.error_callbacks.get(error_record["error_type"], ()):
+            try:
+                callback(error_record)
+            except Exception as callback_error:
+                logger.warning(f"Error callback failed: {str(callback_error)}")
         
         # Execute general callbacks
-        if "*" in self.error_callbacks:
-            for callback in self.error_callbacks["*"]:
-                try:
-                    callback(error_record)
-                except Exception as callback_error:
-                    logger.warning(f"General error callback failed: {str(callback_error)}")
+        for callback in self.error_callbacks.get("*", ()):
+            try:
+                callback(error_record)
+            except Exception as callback_error:
+                logger.warning(f"General error callback failed: {str(callback_error)}")
     
     def _is_recoverable_error(self, error: Exception, severity: ErrorSeverity) -> bool:
         """Determine if error is recoverable."""
@@ -312,57 +367,36 @@ class ErrorHandler:
                              severity: ErrorSeverity, 
                              category: ErrorCategory) -> str:
         """Generate user-friendly error message."""
-        error_type = type(error).__name__
-        
-        # Specific messages for known error types
-        user_messages = {
-            "XMLParsingError": "Unable to parse patient medical record. Please verify the patient name and try again.",
-            "DataValidationError": "Invalid data detected in medical record. Analysis may be incomplete.",
-            "ResearchError": "Unable to access medical research databases. Analysis will continue without research correlation.",
-            "ReportError": "Unable to generate analysis report. Please try again or contact support.",
-            "S3Error": "Unable to save analysis report. The analysis was completed but storage failed.",
-            "AgentCommunicationError": "System communication error occurred. Please try again.",
-            "HallucinationDetectedError": "Potential data integrity issue detected. Analysis has been halted for review.",
-            "ConnectionError": "Network connection error. Please check your connection and try again.",
-            "TimeoutError": "Operation timed out. Please try again or contact support if the problem persists.",
-            "PermissionError": "Access denied. Please check your permissions or contact an administrator."
-        }
-        
-        if error_type in user_messages:
-            return user_messages[error_type]
-        
-        # Generic messages based on severity
-        if severity == ErrorSeverity.CRITICAL:
-            return "A critical system error occurred. Please contact support immediately."
-        elif severity == ErrorSeverity.HIGH:
-            return "A significant error occurred. The operation could not be completed."
-        elif severity == ErrorSeverity.MEDIUM:
-            return "An error occurred, but the operation may have partially completed."
-        else:
-            return "A minor issue was encountered. The operation should continue normally."
+        # Specific messages for known error types, then generic ones by severity
+        message = self._USER_MESSAGES.get(type(error).__name__)
+        if message is not None:
+            return message
+        return self._SEVERITY_MESSAGES[severity]
     
     def register_error_callback(self, error_type: str, callback: Callable[[Dict[str, Any]], None]):
         """Register callback for specific error type."""
-        if error_type not in self.error_callbacks:
-            self.error_callbacks[error_type] = []
         self.error_callbacks[error_type].append(callback)
         logger.info(f"Registered error callback for {error_type}")
     
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get current error statistics."""
-        return self.error_statistics.copy()
+        stats = self.error_statistics.copy()
+        stats["recent_errors"] = list(stats["recent_errors"])
+        return stats
     
     def get_recent_errors(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent errors."""
-        return self.error_statistics["recent_errors"][-limit:]
+        recent_errors = self.error_statistics["recent_errors"]
+        start = max(0, len(recent_errors) - limit)
+        return list(itertools.islice(recent_errors, start, None))
     
     def clear_error_statistics(self):
         """Clear error statistics (for testing or maintenance)."""
         self.error_statistics = {
             "total_errors": 0,
-            "errors_by_category": {},
-            "errors_by_severity": {},
-            "recent_errors": []
+            "errors_by_category": Counter(),
+            "errors_by_severity": Counter(),
+            "recent_errors": deque(maxlen=self.MAX_RECENT_ERRORS)
         }
         logger.info("Error statistics cleared")
 
@@ -372,6 +406,7 @@ def handle_with_context(operation: str,
                        error_handler: Optional[ErrorHandler] = None):
     """Decorator for automatic error handling with context."""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             context = ErrorContext(
                 operation=operation,
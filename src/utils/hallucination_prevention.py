@@ -3,8 +3,9 @@ import logging
 import re
 from typing import Dict, Any, List, Optional, Tuple, Set, Callable
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from collections import defaultdict
 import json
 
 from .enhanced_logging import log_operation
@@ -14,6 +15,62 @@ from ..models.exceptions import HallucinationDetectedError
 
 logger = logging.getLogger(__name__)
 
+# Suspicious patterns that indicate potential hallucination. Each is matched
+# starting at a word boundary, which the fused scan below adds once for all of them.
+_HALLUCINATION_INDICATOR_PATTERNS = (
+    # Fictional medical terms
+    r'(?:fictitious|imaginary|made-up|invented|fake)\s+(?:condition|disease|syndrome|disorder)\b',
+    
+    # Non-medical references
+    r'(?:star wars|harry potter|marvel|dc comics|pokemon|disney)\b',
+    
+    # Impossible medical scenarios
+    r'(?:immortal|invincible|superhuman|magical|supernatural)\s+(?:healing|recovery|treatment)\b',
+    
+    # Placeholder text
+    r'(?:lorem ipsum|placeholder|example|test|dummy|sample)\b',
+    
+    # Nonsensical medical combinations
+    r'(?:digital|virtual|cyber|robotic)\s+(?:organ|limb|brain|heart)\b',
+)
+
+# All indicators fused into one scan: the shared leading word boundary is tested
+# once per position, and the named group says which indicator matched
+_INDICATOR_GROUPS = tuple(f"indicator_{i}" for i in range(len(_HALLUCINATION_INDICATOR_PATTERNS)))
+_HALLUCINATION_INDICATOR_SCAN = re.compile(
+    r'\b(?:' + '|'.join(
+        f"(?P<{group}>{pattern})"
+        for group, pattern in zip(_INDICATOR_GROUPS, _HALLUCINATION_INDICATOR_PATTERNS)
+    ) + ')',
+    re.IGNORECASE
+)
+
+# Token and code extraction (applied to lowercased content unless noted)
+_DRUG_CANDIDATE_PATTERN = re.compile(r'\b[a-z]{3,}\b')
+_DOSAGE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(mg|g|ml|mcg|units?)')
+_ICD_CANDIDATE_PATTERN = re.compile(r'\b[A-Z]\d{2,3}(?:\.\d+)?\b')  # original case
+_CPT_CANDIDATE_PATTERN = re.compile(r'\b\d{5}\b')
+
+# (pattern, description) pairs for logical consistency checks on lowercased content
+_CONDITION_CONTRADICTIONS = (
+    (re.compile(r'\basymptomatic\b.*\bsevere symptoms\b'), 'asymptomatic with severe symptoms'),
+    (re.compile(r'\bnormal\b.*\babnormal\b'), 'normal and abnormal contradiction'),
+    (re.compile(r'\bno history\b.*\bchronic\b'), 'no history but chronic condition'),
+)
+_IMPOSSIBLE_PROCEDURE_COMBINATIONS = (
+    (re.compile(r'\boutpatient\b.*\bmajor surgery\b'), 'outpatient major surgery'),
+    (re.compile(r'\bminimally invasive\b.*\bopen surgery\b'), 'minimally invasive open surgery'),
+)
+_TEMPORAL_INCONSISTENCIES = (
+    (re.compile(r'\bbefore birth\b.*\badult\b'), 'before birth but adult'),
+    (re.compile(r'\bpediatric\b.*\bgeriatric\b'), 'pediatric and geriatric'),
+    (re.compile(r'\bacute\b.*\bchronic\b.*\bsame\b'), 'acute and chronic same condition'),
+)
+_ANATOMICAL_INCONSISTENCIES = (
+    (re.compile(r'\bheart\b.*\blung\b.*\bsame location\b'), 'heart and lung same location'),
+    (re.compile(r'\bbrain\b.*\babdomen\b'), 'brain in abdomen'),
+)
+
 class HallucinationRiskLevel(Enum):
     """Hallucination risk levels."""
     MINIMAL = "minimal"
@@ -42,6 +99,32 @@ class HallucinationCheck:
             "timestamp": datetime.now().isoformat()
         }
 
+# Position of each risk level in PreventionStatistics.by_risk_level (by member or value)
+_RISK_LEVEL_VALUES = tuple(level.value for level in HallucinationRiskLevel)
+_RISK_LEVEL_INDEX = {
+    **{level: index for index, level in enumerate(HallucinationRiskLevel)},
+    **{level.value: index for index, level in enumerate(HallucinationRiskLevel)}
+}
+
+@dataclass(slots=True)
+class PreventionStatistics:
+    """Running hallucination prevention counters."""
+    total_checks: int = 0
+    hallucinations_detected: int = 0
+    high_risk_blocked: int = 0
+    human_reviews_required: int = 0
+    by_risk_level: List[int] = field(default_factory=lambda: [0] * len(_RISK_LEVEL_VALUES))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary layout used for reporting."""
+        return {
+            "total_checks": self.total_checks,
+            "hallucinations_detected": self.hallucinations_detected,
+            "high_risk_blocked": self.high_risk_blocked,
+            "human_reviews_required": self.human_reviews_required,
+            "by_risk_level": dict(zip(_RISK_LEVEL_VALUES, self.by_risk_level))
+        }
+
 class MedicalKnowledgeValidator:
     """Validates medical content against known medical knowledge."""
     
@@ -57,24 +140,6 @@ class MedicalKnowledgeValidator:
         self.cpt_pattern = re.compile(r'^\d{5}$')
         self.ndc_pattern = re.compile(r'^\d{4,5}-\d{3,4}-\d{1,2}$')
         
-        # Suspicious patterns that indicate potential hallucination
-        self.hallucination_indicators = [
-            # Fictional medical terms
-            re.compile(r'\b(?:fictitious|imaginary|made-up|invented|fake)\s+(?:condition|disease|syndrome|disorder)\b', re.IGNORECASE),
-            
-            # Non-medical references
-            re.compile(r'\b(?:star wars|harry potter|marvel|dc comics|pokemon|disney)\b', re.IGNORECASE),
-            
-            # Impossible medical scenarios
-            re.compile(r'\b(?:immortal|invincible|superhuman|magical|supernatural)\s+(?:healing|recovery|treatment)\b', re.IGNORECASE),
-            
-            # Placeholder text
-            re.compile(r'\b(?:lorem ipsum|placeholder|example|test|dummy|sample)\b', re.IGNORECASE),
-            
-            # Nonsensical medical combinations
-            re.compile(r'\b(?:digital|virtual|cyber|robotic)\s+(?:organ|limb|brain|heart)\b', re.IGNORECASE),
-        ]
-        
         logger.info("Medical knowledge validator initialized")
     
     def _load_medical_terms(self) -> Set[str]:
@@ -147,11 +212,8 @@ class MedicalKnowledgeValidator:
         Returns:
             HallucinationCheck: Validation results
         """
-        detected_patterns = []
-        risk_score = 0.0
-        suggested_corrections = []
-        
-        if not content or not content.strip():
+        # Nothing to validate: skip every scan
+        if not content or content.isspace():
             return HallucinationCheck(
                 risk_level=HallucinationRiskLevel.MINIMAL,
                 confidence=1.0,
@@ -160,31 +222,39 @@ class MedicalKnowledgeValidator:
                 requires_human_review=False
             )
         
+        detected_patterns = []
+        risk_score = 0.0
+        suggested_corrections = []
+        
+        # Lowercased once and shared by every case-insensitive check below
         content_lower = content.lower()
         
-        # Check for hallucination indicators
-        for pattern in self.hallucination_indicators:
-            matches = pattern.findall(content)
+        # Check for hallucination indicators (one pass, reported in indicator order)
+        matches_by_indicator = defaultdict(list)
+        for match in _HALLUCINATION_INDICATOR_SCAN.finditer(content):
+            matches_by_indicator[match.lastgroup].append(match.group())
+        for group in _INDICATOR_GROUPS:
+            matches = matches_by_indicator.get(group)
             if matches:
                 detected_patterns.append(f"Suspicious pattern: {', '.join(set(matches))}")
                 risk_score += 0.4
         
         # Validate medical terms based on content type
         if content_type == "medication":
-            risk_score += self._validate_medications(content, detected_patterns, suggested_corrections)
+            risk_score += self._validate_medications(content, detected_patterns, suggested_corrections, content_lower)
         elif content_type == "condition":
-            risk_score += self._validate_conditions(content, detected_patterns, suggested_corrections)
+            risk_score += self._validate_conditions(content, detected_patterns, suggested_corrections, content_lower)
         elif content_type == "procedure":
-            risk_score += self._validate_procedures(content, detected_patterns, suggested_corrections)
+            risk_score += self._validate_procedures(content, detected_patterns, suggested_corrections, content_lower)
         else:
             # General medical content validation
-            risk_score += self._validate_general_medical_content(content, detected_patterns, suggested_corrections)
+            risk_score += self._validate_general_medical_content(content, detected_patterns, suggested_corrections, content_lower)
         
         # Check for medical code validity
         risk_score += self._validate_medical_codes(content, detected_patterns, suggested_corrections)
         
         # Check for logical consistency
-        risk_score += self._check_logical_consistency(content, detected_patterns, suggested_corrections)
+        risk_score += self._check_logical_consistency(content, detected_patterns, suggested_corrections, content_lower)
         
         # Normalize risk score
         risk_score = min(risk_score, 1.0)
@@ -212,20 +282,25 @@ class MedicalKnowledgeValidator:
         )
     
     def _validate_medications(self, content: str, detected_patterns: List[str], 
-                            suggested_corrections: List[str]) -> float:
+                            suggested_corrections: List[str],
+                            content_lower: Optional[str] = None) -> float:
         """Validate medication-related content."""
         risk_score = 0.0
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         
         # Extract potential drug names
-        potential_drugs = re.findall(r'\b[a-z]{3,}\b', content_lower)
+        potential_drugs = _DRUG_CANDIDATE_PATTERN.findall(content_lower)
         
-        unknown_drugs = []
-        for drug in potential_drugs:
-            if drug not in self.valid_drug_names and len(drug) > 4:
-                # Check if it might be a brand name or generic variation
-                if not any(known_drug in drug or drug in known_drug for known_drug in self.valid_drug_names):
-                    unknown_drugs.append(drug)
+        # Words recur within a note ("daily"), so each distinct word is looked up once per call
+        known_words = {
+            drug: self._word_matches_known_drug(drug)
+            for drug in set(potential_drugs) if len(drug) > 4
+        }
+        unknown_drugs = [
+            drug for drug in potential_drugs
+            if len(drug) > 4 and not known_words[drug]
+        ]
         
         if unknown_drugs:
             detected_patterns.append(f"Unknown medications: {', '.join(unknown_drugs[:3])}")
@@ -233,7 +308,7 @@ class MedicalKnowledgeValidator:
             risk_score += 0.3 * min(len(unknown_drugs) / 5, 1.0)
         
         # Check for impossible dosages
-        dosage_patterns = re.findall(r'(\d+(?:\.\d+)?)\s*(mg|g|ml|mcg|units?)', content_lower)
+        dosage_patterns = _DOSAGE_PATTERN.findall(content_lower)
         for amount, unit in dosage_patterns:
             try:
                 dose = float(amount)
@@ -249,33 +324,30 @@ class MedicalKnowledgeValidator:
         
         return risk_score
     
+    def _word_matches_known_drug(self, word: str) -> bool:
+        """Check whether a word is a known drug or a brand/generic variation of one."""
+        if word in self.valid_drug_names:
+            return True
+        return any(known_drug in word or word in known_drug for known_drug in self.valid_drug_names)
+    
     def _validate_conditions(self, content: str, detected_patterns: List[str], 
-                           suggested_corrections: List[str]) -> float:
+                           suggested_corrections: List[str],
+                           content_lower: Optional[str] = None) -> float:
         """Validate medical condition content."""
         risk_score = 0.0
-        content_lower = content.lower()
-        
-        # Check for known condition names
-        found_conditions = []
-        for condition in self.valid_condition_names:
-            if condition in content_lower:
-                found_conditions.append(condition)
+        if content_lower is None:
+            content_lower = content.lower()
         
         # If no known conditions found in a condition-focused content, it's suspicious
-        if not found_conditions and len(content) > 20:
+        # (the length check is cheap, and one known condition ends the scan)
+        if len(content) > 20 and not any(condition in content_lower for condition in self.valid_condition_names):
             detected_patterns.append("No recognized medical conditions found")
             suggested_corrections.append("Verify condition names against medical terminology")
             risk_score += 0.3
         
         # Check for contradictory statements
-        contradictions = [
-            (r'\basymptomatic\b.*\bsevere symptoms\b', 'asymptomatic with severe symptoms'),
-            (r'\bnormal\b.*\babnormal\b', 'normal and abnormal contradiction'),
-            (r'\bno history\b.*\bchronic\b', 'no history but chronic condition')
-        ]
-        
-        for pattern, description in contradictions:
-            if re.search(pattern, content_lower):
+        for pattern, description in _CONDITION_CONTRADICTIONS:
+            if pattern.search(content_lower):
                 detected_patterns.append(f"Contradiction detected: {description}")
                 suggested_corrections.append("Review for logical consistency")
                 risk_score += 0.4
@@ -283,25 +355,16 @@ class MedicalKnowledgeValidator:
         return risk_score
     
     def _validate_procedures(self, content: str, detected_patterns: List[str], 
-                          suggested_corrections: List[str]) -> float:
+                          suggested_corrections: List[str],
+                          content_lower: Optional[str] = None) -> float:
         """Validate medical procedure content."""
         risk_score = 0.0
-        content_lower = content.lower()
-        
-        # Check for known procedures
-        found_procedures = []
-        for procedure in self.valid_procedure_names:
-            if procedure in content_lower:
-                found_procedures.append(procedure)
+        if content_lower is None:
+            content_lower = content.lower()
         
         # Check for impossible procedure combinations
-        impossible_combinations = [
-            (r'\boutpatient\b.*\bmajor surgery\b', 'outpatient major surgery'),
-            (r'\bminimally invasive\b.*\bopen surgery\b', 'minimally invasive open surgery')
-        ]
-        
-        for pattern, description in impossible_combinations:
-            if re.search(pattern, content_lower):
+        for pattern, description in _IMPOSSIBLE_PROCEDURE_COMBINATIONS:
+            if pattern.search(content_lower):
                 detected_patterns.append(f"Impossible combination: {description}")
                 suggested_corrections.append("Review procedure descriptions for accuracy")
                 risk_score += 0.3
@@ -309,35 +372,43 @@ class MedicalKnowledgeValidator:
         return risk_score
     
     def _validate_general_medical_content(self, content: str, detected_patterns: List[str], 
-                                        suggested_corrections: List[str]) -> float:
+                                        suggested_corrections: List[str],
+                                        content_lower: Optional[str] = None) -> float:
         """Validate general medical content."""
         risk_score = 0.0
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         
-        # Check for medical term density
-        medical_terms_found = 0
+        # Check for medical term density (only judged for content over 20 words)
         total_words = len(content.split())
         
-        for term in self.valid_medical_terms:
-            if term in content_lower:
-                medical_terms_found += 1
-        
         # If very few medical terms in supposedly medical content
-        if total_words > 20 and medical_terms_found / total_words < 0.1:
+        if total_words > 20 and not self._has_medical_term_density(content_lower, total_words):
             detected_patterns.append("Low medical terminology density")
             suggested_corrections.append("Ensure content is medically relevant")
             risk_score += 0.2
         
         return risk_score
     
+    def _has_medical_term_density(self, content_lower: str, total_words: int) -> bool:
+        """Check whether known medical terms make up at least 10% of total_words."""
+        medical_terms_found = 0
+        for term in self.valid_medical_terms:
+            if term in content_lower:
+                medical_terms_found += 1
+                # Stop as soon as the density threshold is reached
+                if medical_terms_found * 10 >= total_words:
+                    return True
+        return False
+    
     def _validate_medical_codes(self, content: str, detected_patterns: List[str], 
                               suggested_corrections: List[str]) -> float:
         """Validate medical codes in content."""
         risk_score = 0.0
         
         # Find potential medical codes
-        potential_icd_codes = re.findall(r'\b[A-Z]\d{2,3}(?:\.\d+)?\b', content)
-        potential_cpt_codes = re.findall(r'\b\d{5}\b', content)
+        potential_icd_codes = _ICD_CANDIDATE_PATTERN.findall(content)
+        potential_cpt_codes = _CPT_CANDIDATE_PATTERN.findall(content)
         
         # Validate ICD codes
         for code in potential_icd_codes:
@@ -355,32 +426,23 @@ class MedicalKnowledgeValidator:
         return risk_score
     
     def _check_logical_consistency(self, content: str, detected_patterns: List[str], 
-                                 suggested_corrections: List[str]) -> float:
+                                 suggested_corrections: List[str],
+                                 content_lower: Optional[str] = None) -> float:
         """Check for logical consistency in medical content."""
         risk_score = 0.0
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
         
         # Check for temporal inconsistencies
-        temporal_issues = [
-            (r'\bbefore birth\b.*\badult\b', 'before birth but adult'),
-            (r'\bpediatric\b.*\bgeriatric\b', 'pediatric and geriatric'),
-            (r'\bacute\b.*\bchronic\b.*\bsame\b', 'acute and chronic same condition')
-        ]
-        
-        for pattern, description in temporal_issues:
-            if re.search(pattern, content_lower):
+        for pattern, description in _TEMPORAL_INCONSISTENCIES:
+            if pattern.search(content_lower):
                 detected_patterns.append(f"Temporal inconsistency: {description}")
                 suggested_corrections.append("Review temporal relationships in content")
                 risk_score += 0.3
         
         # Check for anatomical impossibilities
-        anatomical_issues = [
-            (r'\bheart\b.*\blung\b.*\bsame location\b', 'heart and lung same location'),
-            (r'\bbrain\b.*\babdomen\b', 'brain in abdomen')
-        ]
-        
-        for pattern, description in anatomical_issues:
-            if re.search(pattern, content_lower):
+        for pattern, description in _ANATOMICAL_INCONSISTENCIES:
+            if pattern.search(content_lower):
                 detected_patterns.append(f"Anatomical inconsistency: {description}")
                 risk_score += 0.4
         
@@ -408,16 +470,14 @@ class HallucinationPreventionSystem:
         self.medical_validator = MedicalKnowledgeValidator()
         
         # Prevention statistics
-        self.prevention_stats = {
-            "total_checks": 0,
-            "hallucinations_detected": 0,
-            "high_risk_blocked": 0,
-            "human_reviews_required": 0,
-            "by_risk_level": {getattr(level, 'value', str(level)): 0 for level in HallucinationRiskLevel}
-        }
+        self.reset_statistics()
         
         logger.info(f"Hallucination prevention system initialized (strict_mode: {strict_mode})")
     
+    def reset_statistics(self):
+        """Reset prevention statistics to zero."""
+        self.statistics = PreventionStatistics()
+    
     def check_content(self, content: str, content_type: str = "general", 
                      patient_id: Optional[str] = None, 
                      operation: str = "content_validation") -> HallucinationCheck:
@@ -438,20 +498,20 @@ class HallucinationPreventionSystem:
         """
         with log_operation(operation, "hallucination_prevention", patient_id or "UNKNOWN"):
             
-            self.prevention_stats["total_checks"] += 1
+            stats = self.statistics
+            stats.total_checks += 1
             
             # Perform validation
             check_result = self.medical_validator.validate_medical_content(content, content_type)
             
             # Update statistics
-            key = getattr(check_result.risk_level, 'value', str(check_result.risk_level))
-            self.prevention_stats["by_risk_level"][key] += 1
+            stats.by_risk_level[_RISK_LEVEL_INDEX[check_result.risk_level]] += 1
             
             if check_result.risk_level in [HallucinationRiskLevel.HIGH, HallucinationRiskLevel.CRITICAL]:
-                self.prevention_stats["hallucinations_detected"] += 1
+                stats.hallucinations_detected += 1
                 
                 if check_result.requires_human_review:
-                    self.prevention_stats["human_reviews_required"] += 1
+                    stats.human_reviews_required += 1
                 
                 # Log high-risk detection
                 if self.audit_logger:
@@ -470,7 +530,7 @@ class HallucinationPreventionSystem:
                 
                 # In strict mode, raise exception for high-risk hallucinations
                 if self.strict_mode and check_result.risk_level == HallucinationRiskLevel.CRITICAL:
-                    self.prevention_stats["high_risk_blocked"] += 1
+                    stats.high_risk_blocked += 1
                     
                     error_context = ErrorContext(
                         operation=operation,
@@ -504,7 +564,7 @@ class HallucinationPreventionSystem:
     
     def get_prevention_statistics(self) -> Dict[str, Any]:
         """Get hallucination prevention statistics."""
-        stats = self.prevention_stats.copy()
+        stats = self.statistics.to_dict()
         
         # Calculate rates
         if stats["total_checks"] > 0:
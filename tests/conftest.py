@@ -0,0 +1,68 @@
+"""Shared pytest fixtures for the test suite."""
+import asyncio
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from src.cli.interface import EnhancedCLI
+from src.utils.audit_logger import AuditLogger
+from src.workflow.main_workflow import MainWorkflow
+
+
+def pytest_configure(config):
+    """Register custom markers used across the test suite."""
+    config.addinivalue_line(
+        "markers", "slow: integration-heavy tests; deselect with -m 'not slow'"
+    )
+    config.addinivalue_line(
+        "markers", "performance: performance benchmark tests; deselect with -m 'not performance'"
+    )
+
+
+class _StubAuditLogger:
+    """Audit logger stand-in that records log_error calls without spec introspection."""
+
+    def __init__(self):
+        self.log_error = MagicMock()
+
+
+@pytest.fixture(scope="module")
+def stub_audit_logger():
+    """Create a stub audit logger shared by a module's tests."""
+    return _StubAuditLogger()
+
+
+@pytest.fixture(scope="session")
+def cli():
+    """Create a single EnhancedCLI instance shared across the session."""
+    return EnhancedCLI()
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Run every asyncio test on one event loop shared across the session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def workflow():
+    """Create a single MainWorkflow, with a mocked audit logger, shared across the session.
+
+    Building the workflow wires every agent and QA subsystem, so tests share one
+    instance and reset its audit logger mock and statistics between tests.
+    """
+    return MainWorkflow(
+        audit_logger=Mock(spec=AuditLogger),
+        enable_enhanced_logging=False,
+        timeout_seconds=60
+    )
+
+
+@pytest.fixture
+def patched_boto(mocker):
+    """Patch the XML parser's boto3 client factory and return the mocked S3 client."""
+    client = mocker.Mock()
+    mocker.patch('src.agents.xml_parser_agent.boto3.client', return_value=client)
+    return client
@@ -359,6 +359,12 @@ SAMPLE_PATIENT_XML_INVALID = """<?xml version="1.0" encoding="UTF-8"?>
     </medical_history>
 </patient_record>"""
 
+# UTF-8 encoded payloads, as returned by a mocked S3 object body
+SAMPLE_PATIENT_XML_GOOD_BYTES = SAMPLE_PATIENT_XML_GOOD.encode('utf-8')
+SAMPLE_PATIENT_XML_COMPLEX_BYTES = SAMPLE_PATIENT_XML_COMPLEX.encode('utf-8')
+SAMPLE_PATIENT_XML_MINIMAL_BYTES = SAMPLE_PATIENT_XML_MINIMAL.encode('utf-8')
+SAMPLE_PATIENT_XML_INVALID_BYTES = SAMPLE_PATIENT_XML_INVALID.encode('utf-8')
+
 # Expected analysis results for validation
 EXPECTED_ANALYSIS_RESULTS = {
     "TEST_P001": {
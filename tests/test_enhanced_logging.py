@@ -1,16 +1,27 @@
 """Tests for enhanced logging system."""
 import pytest
+import gc
 import logging
-import json
+import logging.handlers
 import tempfile
+import threading
 import time
 from pathlib import Path
+from datetime import datetime
+from queue import Queue
 from unittest.mock import Mock, patch, MagicMock
 
+from botocore.exceptions import NoCredentialsError
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to stdlib json
+    from json import loads as json_loads
+
 from src.utils.enhanced_logging import (
     EnhancedLoggingSystem, PerformanceMonitor, StructuredFormatter,
     PerformanceMetric, initialize_logging, get_logging_system,
-    get_performance_monitor, log_operation
+    get_performance_monitor, log_operation, S3LogHandler, _stop_queue_listener
 )
 
 class TestPerformanceMetric:
@@ -76,7 +87,7 @@ class TestStructuredFormatter:
         )
         
         formatted = formatter.format(record)
-        log_data = json.loads(formatted)
+        log_data = json_loads(formatted)
         
         assert log_data["level"] == "INFO"
         assert log_data["logger"] == "test.logger"
@@ -84,6 +95,19 @@ class TestStructuredFormatter:
         assert log_data["line"] == 10
         assert "timestamp" in log_data
     
+    @pytest.mark.parametrize("created", [
+        1700000000.0,
+        1700000000.1234564,
+        1700000000.1234566,
+        1700000000.9999994,
+        1700000000.9999996,
+    ])
+    def test_timestamp_rounds_like_datetime(self, created):
+        """Test timestamps round to the nearest microsecond and carry into the next second."""
+        expected = datetime.fromtimestamp(created).strftime("%Y-%m-%dT%H:%M:%S.%f")
+        
+        assert StructuredFormatter._format_timestamp(created) == expected
+    
     def test_formatting_with_extra_fields(self):
         """Test formatting with extra fields."""
         formatter = StructuredFormatter()
@@ -105,7 +129,7 @@ class TestStructuredFormatter:
         record.component = "test_component"
         
         formatted = formatter.format(record)
-        log_data = json.loads(formatted)
+        log_data = json_loads(formatted)
         
         assert log_data["patient_id"] == "PATIENT123"
         assert log_data["operation"] == "test_operation"
@@ -130,13 +154,73 @@ class TestStructuredFormatter:
             )
             
             formatted = formatter.format(record)
-            log_data = json.loads(formatted)
+            log_data = json_loads(formatted)
             
             assert "exception" in log_data
             assert log_data["exception"]["type"] == "ValueError"
             assert log_data["exception"]["message"] == "Test exception"
             assert "traceback" in log_data["exception"]
 
+    def test_build_record_matches_formatted_output(self):
+        """Test that the structured dict is what format() serializes."""
+        formatter = StructuredFormatter()
+        
+        logger = logging.getLogger("test")
+        record = logger.makeRecord(
+            name="test.logger",
+            level=logging.INFO,
+            fn="test.py",
+            lno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None
+        )
+        record.patient_id = "PATIENT123"
+        
+        log_data = formatter._build_record(record)
+        
+        assert log_data["patient_id"] == "PATIENT123"
+        assert log_data["message"] == "Test message"
+        assert json_loads(formatter.format(record)) == log_data
+
+class TestS3LogHandler:
+    """Test S3LogHandler class."""
+    
+    def test_failed_upload_drops_buffer(self):
+        """Test a batch that fails to upload (e.g. missing credentials) is not retained."""
+        with patch("src.utils.enhanced_logging.boto3.client") as mock_client:
+            mock_client.return_value.put_object.side_effect = NoCredentialsError()
+            handler = S3LogHandler(bucket_name="test-bucket")
+        
+        record = logging.getLogger("test").makeRecord(
+            "test.logger", logging.INFO, "test.py", 10, "Test message", (), None
+        )
+        for _ in range(handler.buffer_size * 2):
+            handler.emit(record)
+        
+        assert handler.log_buffer == []
+        assert handler.s3_client.put_object.call_count == 2
+
+class TestQueueListenerShutdown:
+    """Test stopping background log listeners."""
+    
+    def test_stop_queue_listener_bounds_the_wait(self):
+        """Test a listener stuck in a slow handler does not block its caller."""
+        release = threading.Event()
+        blocking_handler = logging.Handler()
+        blocking_handler.emit = lambda record: release.wait(5)
+        listener = logging.handlers.QueueListener(Queue(), blocking_handler)
+        listener.start()
+        listener.queue.put(logging.makeLogRecord({"msg": "slow"}))
+        
+        start = time.perf_counter()
+        _stop_queue_listener(listener, timeout=0.1)
+        elapsed = time.perf_counter() - start
+        release.set()
+        
+        assert elapsed < 2
+        assert listener._thread is None
+
 class TestPerformanceMonitor:
     """Test PerformanceMonitor class."""
     
@@ -248,6 +332,60 @@ class TestPerformanceMonitor:
         
         assert len(performance_monitor.metrics) == 0
         assert performance_monitor.stats["total_operations"] == 0
+    
+    def test_metrics_from_multiple_threads(self):
+        """Test that metrics buffered by worker threads are all visible."""
+        performance_monitor = PerformanceMonitor(max_metrics=1000)
+        
+        def record_operations():
+            for i in range(50):
+                with performance_monitor.measure_operation(f"op{i}", "threaded"):
+                    pass
+        
+        workers = [threading.Thread(target=record_operations) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert len(performance_monitor.metrics) == 200
+        assert performance_monitor.stats["total_operations"] == 200
+    
+    def test_exited_thread_shards_are_folded(self):
+        """Test that shards of finished threads are retired without losing their counts."""
+        performance_monitor = PerformanceMonitor(max_metrics=1000)
+        
+        def record_operation(i):
+            with performance_monitor.measure_operation(f"op{i}", "churn"):
+                pass
+        
+        for i in range(20):
+            worker = threading.Thread(target=record_operation, args=(i,))
+            worker.start()
+            worker.join()
+        gc.collect()
+        
+        # Registering the main thread's shard folds the exited ones
+        record_operation(20)
+        
+        retired, live_shards = performance_monitor._registry
+        assert len(live_shards) == 1
+        assert retired.successful == 20
+        stats = performance_monitor.stats
+        assert stats["total_operations"] == 21
+        assert stats["operations_by_component"]["churn"]["count"] == 21
+        assert len(performance_monitor.metrics) == 21
+    
+    def test_metrics_read_does_not_flush(self, performance_monitor):
+        """Test that reading metrics returns a snapshot and leaves buffered metrics in place."""
+        with performance_monitor.measure_operation("test_op", "test_comp"):
+            pass
+        
+        snapshot = performance_monitor.metrics
+        snapshot.clear()
+        
+        assert len(performance_monitor._metrics) == 0
+        assert len(performance_monitor.metrics) == 1
 
 class TestEnhancedLoggingSystem:
     """Test EnhancedLoggingSystem class."""
@@ -310,6 +448,19 @@ class TestEnhancedLoggingSystem:
             assert call_args[1]["extra"]["operation"] == "test_operation"
             assert call_args[1]["extra"]["patient_id"] == "PATIENT123"
     
+    def test_operation_logging_skipped_when_disabled(self, logging_system):
+        """Test that filtered operation events are not built or emitted."""
+        with patch('logging.getLogger') as mock_get_logger:
+            mock_logger = Mock()
+            mock_logger.isEnabledFor.return_value = False
+            mock_get_logger.return_value = mock_logger
+            
+            logging_system.log_operation_start("test_operation", "quiet_component")
+            logging_system.log_operation_end("test_operation", "quiet_component")
+            
+            mock_logger.info.assert_not_called()
+            mock_logger.log.assert_not_called()
+    
     def test_log_statistics(self, logging_system, temp_log_dir):
         """Test log statistics collection."""
         # Create some log files
@@ -432,13 +583,16 @@ class TestLoggingIntegration:
             
             root_logger = logging.getLogger()
             
-            # Should have multiple handlers (console, main log, error log, etc.)
-            assert len(root_logger.handlers) >= 3
-            
-            # Check for different handler types
+            # Console logs directly; file handlers are fed through a queue
             handler_types = [type(handler).__name__ for handler in root_logger.handlers]
             assert "StreamHandler" in handler_types  # Console
-            assert "RotatingFileHandler" in handler_types  # File handlers
+            assert "InProcessQueueHandler" in handler_types
+            
+            # Listener should drive multiple file handlers (main log, error log, etc.)
+            listener_handlers = system.queue_listener.handlers
+            assert len(listener_handlers) >= 3
+            listener_types = [type(handler).__name__ for handler in listener_handlers]
+            assert "RotatingFileHandler" in listener_types  # File handlers
     
     @patch('logging.getLogger')
     def test_component_logger_setup(self, mock_get_logger):
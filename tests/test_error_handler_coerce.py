@@ -32,3 +32,25 @@ def test_classification_strings_are_coerced_and_logged(caplog, monkeypatch):
     warnings = [r.message for r in caplog.records if r.levelno == logging.WARNING]
     found = any("Raw classification types detected" in str(m) for m in warnings)
     assert found, f"Expected raw classification warning in logs, got: {warnings}"
+
+
+def test_coerced_classification_is_cached_and_warned_once(caplog):
+    """Coerced enums are written back so repeated errors only warn once."""
+    caplog.set_level(logging.WARNING)
+
+    handler = ErrorHandler()
+    handler.error_classification[DummyError] = ("network", "high")
+
+    for _ in range(3):
+        result = handler.handle_error(DummyError("boom"), ErrorContext(operation="test_op"))
+        assert result["category"] == "network"
+        assert result["severity"] == "high"
+
+    raw_warnings = [
+        r for r in caplog.records
+        if "Raw classification types detected" in r.getMessage()
+    ]
+    assert len(raw_warnings) == 1
+    category, severity = handler.error_classification[DummyError]
+    assert category.value == "network"
+    assert severity.value == "high"
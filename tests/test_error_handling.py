@@ -17,6 +17,25 @@ from src.models.exceptions import (
     ReportError, S3Error, AgentCommunicationError, HallucinationDetectedError
 )
 
+class _RaisingAuditLogger:
+    """Audit logger stand-in whose log_error always fails."""
+    
+    def log_error(self, *args, **kwargs):
+        raise Exception("Audit logger failed")
+
+@pytest.fixture(scope="module")
+def error_handler(stub_audit_logger):
+    """Create error handler with mock audit logger shared by the module's tests."""
+    return ErrorHandler(audit_logger=stub_audit_logger)
+
+@pytest.fixture(autouse=True)
+def reset_error_handler(error_handler, stub_audit_logger):
+    """Reset the shared handler and audit logger before each test in the module."""
+    error_handler.clear_error_statistics()
+    error_handler.error_callbacks.clear()
+    stub_audit_logger.log_error.reset_mock()
+    yield
+
 class TestErrorContext:
     """Test ErrorContext class."""
     
@@ -49,39 +68,73 @@ class TestErrorContext:
         assert context_dict["patient_id"] == "PATIENT123"
         assert "error_id" in context_dict
         assert "timestamp" in context_dict
+    
+    def test_error_context_to_dict_returns_independent_copies(self):
+        """Test that mutating a returned dict does not change later conversions."""
+        context = ErrorContext(operation="test_operation", patient_id="PATIENT123")
+        
+        first = context.to_dict()
+        first["patient_id"] = "CHANGED"
+        
+        assert context.to_dict()["patient_id"] == "PATIENT123"
+        assert context.to_dict() is not context.to_dict()
+    
+    def test_error_record_context_mutation_does_not_leak(self, error_handler):
+        """Test that a callback mutating the record's context leaves the context intact."""
+        context = ErrorContext("test", "PATIENT123", "test")
+        error_handler.register_error_callback("ValueError", lambda record: record["context"].clear())
+        
+        error_handler.handle_error(ValueError("Test error"), context)
+        
+        assert context.to_dict()["operation"] == "test"
+    
+    def test_error_ids_are_distinct_for_same_operation(self):
+        """Test that contexts for the same operation get distinct error IDs."""
+        error_ids = {ErrorContext(operation="test_operation").error_id for _ in range(10)}
+        
+        assert len(error_ids) == 10
+    
+    def test_error_context_uses_slots(self):
+        """Test that error contexts carry no per-instance __dict__."""
+        context = ErrorContext(operation="test_operation")
+        
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.unexpected_attribute = "value"
 
 class TestErrorHandler:
     """Test ErrorHandler class."""
     
-    @pytest.fixture
-    def mock_audit_logger(self):
-        """Create mock audit logger."""
-        return Mock(spec=AuditLogger)
-    
-    @pytest.fixture
-    def error_handler(self, mock_audit_logger):
-        """Create error handler with mock audit logger."""
-        return ErrorHandler(audit_logger=mock_audit_logger)
-    
     def test_error_handler_initialization(self, error_handler):
         """Test error handler initialization."""
         assert error_handler.audit_logger is not None
         assert error_handler.error_callbacks == {}
         assert error_handler.error_statistics["total_errors"] == 0
     
-    def test_error_classification(self, error_handler):
-        """Test error classification."""
-        # Test known error types
-        xml_error = XMLParsingError("XML parsing failed")
-        category, severity = error_handler._classify_error(xml_error)
-        assert category == ErrorCategory.DATA
-        assert severity == ErrorSeverity.HIGH
+    @pytest.mark.parametrize(
+        "error, expected_category, expected_severity",
+        [
+            (XMLParsingError("XML parsing failed"), ErrorCategory.DATA, ErrorSeverity.HIGH),
+            (RuntimeError("Unknown error"), ErrorCategory.SYSTEM, ErrorSeverity.HIGH),
+        ],
+        ids=["xml", "runtime"]
+    )
+    def test_error_classification(self, error_handler, error, expected_category, expected_severity):
+        """Test error classification of known and unknown error types."""
+        category, severity = error_handler._classify_error(error)
+        assert category == expected_category
+        assert severity == expected_severity
+    
+    def test_inherited_classification_is_cached(self, error_handler):
+        """Test that subclasses are classified like their base and cached by type."""
+        class CustomValueError(ValueError):
+            pass
         
-        # Test unknown error type
-        unknown_error = RuntimeError("Unknown error")
-        category, severity = error_handler._classify_error(unknown_error)
-        assert category == ErrorCategory.SYSTEM
-        assert severity == ErrorSeverity.HIGH
+        category, severity = error_handler._classify_error(CustomValueError("bad value"))
+        assert category == ErrorCategory.DATA
+        assert severity == ErrorSeverity.MEDIUM
+        assert error_handler._classification_cache[CustomValueError] == (category, severity)
+        assert error_handler._classify_error(CustomValueError("again")) == (category, severity)
     
     def test_handle_error_basic(self, error_handler):
         """Test basic error handling."""
@@ -119,22 +172,28 @@ class TestErrorHandler:
         assert result["severity"] == "critical"
         assert result["is_recoverable"] is False
     
-    def test_error_statistics_update(self, error_handler):
-        """Test error statistics updates."""
-        initial_stats = error_handler.get_error_statistics()
-        assert initial_stats["total_errors"] == 0
+    @pytest.mark.parametrize(
+        "action, expected_total",
+        [("noop", 1), ("clear", 0)]
+    )
+    def test_statistics_lifecycle(self, error_handler, action, expected_total):
+        """Test error statistics updates and clearing."""
+        assert error_handler.get_error_statistics()["total_errors"] == 0
         
         # Handle an error
         error = DataValidationError("Invalid data")
         context = ErrorContext("validation", "PATIENT123", "validator")
         error_handler.handle_error(error, context)
         
-        updated_stats = error_handler.get_error_statistics()
-        assert updated_stats["total_errors"] == 1
-        assert "data" in updated_stats["errors_by_category"]
-        assert "medium" in updated_stats["errors_by_severity"]
+        if action == "clear":
+            error_handler.clear_error_statistics()
+        
+        stats = error_handler.get_error_statistics()
+        assert stats["total_errors"] == expected_total
+        assert ("data" in stats["errors_by_category"]) == (expected_total > 0)
+        assert ("medium" in stats["errors_by_severity"]) == (expected_total > 0)
     
-    def test_audit_logging_integration(self, error_handler, mock_audit_logger):
+    def test_audit_logging_integration(self, error_handler, stub_audit_logger):
         """Test integration with audit logger."""
         error = XMLParsingError("XML parsing failed")
         context = ErrorContext("xml_parsing", "PATIENT123", "xml_parser")
@@ -142,8 +201,8 @@ class TestErrorHandler:
         error_handler.handle_error(error, context)
         
         # Verify audit logger was called
-        mock_audit_logger.log_error.assert_called_once()
-        call_args = mock_audit_logger.log_error.call_args
+        stub_audit_logger.log_error.assert_called_once()
+        call_args = stub_audit_logger.log_error.call_args
         assert call_args[1]["patient_id"] == "PATIENT123"
         assert call_args[1]["operation"] == "xml_parsing"
         assert call_args[1]["error"] == error
@@ -169,21 +228,39 @@ class TestErrorHandler:
         assert callback_called is True
         assert callback_data["error_type"] == "ValueError"
     
-    def test_user_message_generation(self, error_handler):
+    def test_stack_trace_in_error_record(self, error_handler):
+        """Test that the error record carries the handled exception's stack trace as text."""
+        records = []
+        error_handler.register_error_callback("ValueError", records.append)
+        
+        try:
+            raise ValueError("Traced error")
+        except ValueError as error:
+            error_handler.handle_error(error, ErrorContext("trace", "PATIENT123", "test"))
+        
+        stack_trace = records[0]["stack_trace"]
+        assert isinstance(stack_trace, str)
+        assert "Traceback" in stack_trace
+        assert "ValueError: Traced error" in stack_trace
+        # Callbacks and audit sinks serialize the record as-is
+        assert json.loads(json.dumps(records[0]))["stack_trace"] == stack_trace
+    
+    @pytest.mark.parametrize(
+        "error, operation, component, expected_message",
+        [
+            (XMLParsingError("XML parsing failed"), "xml_parsing", "xml_parser",
+             "Unable to parse patient medical record"),
+            (RuntimeError("Unknown error"), "unknown", "unknown",
+             "significant error occurred"),
+        ],
+        ids=["specific", "generic"]
+    )
+    def test_user_message_generation(self, error_handler, error, operation, component, expected_message):
         """Test user-friendly message generation."""
-        # Test specific error message
-        error = XMLParsingError("XML parsing failed")
-        context = ErrorContext("xml_parsing", "PATIENT123", "xml_parser")
-        result = error_handler.handle_error(error, context)
-        
-        assert "Unable to parse patient medical record" in result["user_message"]
-        
-        # Test generic error message
-        error = RuntimeError("Unknown error")
-        context = ErrorContext("unknown", "PATIENT123", "unknown")
+        context = ErrorContext(operation, "PATIENT123", component)
         result = error_handler.handle_error(error, context)
         
-        assert "significant error occurred" in result["user_message"]
+        assert expected_message in result["user_message"]
     
     def test_recoverable_error_detection(self, error_handler):
         """Test recoverable error detection."""
@@ -198,36 +275,46 @@ class TestErrorHandler:
     def test_recent_errors_tracking(self, error_handler):
         """Test recent errors tracking."""
         # Handle multiple errors
-        for i in range(5):
-            error = ValueError(f"Error {i}")
-            context = ErrorContext(f"operation_{i}", "PATIENT123", "test")
-            error_handler.handle_error(error, context)
+        contexts = [ErrorContext(f"operation_{i}", "PATIENT123", "test") for i in range(5)]
+        for i, context in enumerate(contexts):
+            error_handler.handle_error(ValueError(f"Error {i}"), context)
         
         recent_errors = error_handler.get_recent_errors(3)
         assert len(recent_errors) == 3
         assert recent_errors[-1]["error_type"] == "ValueError"
+        assert [e["error_id"] for e in recent_errors] == [c.error_id for c in contexts[2:]]
     
-    def test_error_statistics_clearing(self, error_handler):
-        """Test error statistics clearing."""
-        # Handle an error
-        error = ValueError("Test error")
-        context = ErrorContext("test", "PATIENT123", "test")
-        error_handler.handle_error(error, context)
+    def test_recent_errors_drop_oldest_beyond_limit(self, error_handler):
+        """Test that only the newest MAX_RECENT_ERRORS errors are kept."""
+        overflow = 5
+        contexts = [
+            ErrorContext(f"operation_{i}", "PATIENT123", "test")
+            for i in range(ErrorHandler.MAX_RECENT_ERRORS + overflow)
+        ]
+        for i, context in enumerate(contexts):
+            error_handler.handle_error(ValueError(f"Error {i}"), context)
         
-        assert error_handler.get_error_statistics()["total_errors"] == 1
+        recent_errors = error_handler.get_recent_errors(len(contexts))
+        assert len(recent_errors) == ErrorHandler.MAX_RECENT_ERRORS
+        assert [e["error_id"] for e in recent_errors] == [c.error_id for c in contexts[overflow:]]
+        assert error_handler.get_error_statistics()["total_errors"] == len(contexts)
+    
+    def test_handlers_do_not_share_state(self, error_handler):
+        """Test that separate handlers keep independent state (safe for parallel runs)."""
+        class OtherError(RuntimeError):
+            pass
+        
+        other_handler = ErrorHandler()
+        other_handler.register_error_callback("*", lambda record: None)
+        other_handler.handle_error(OtherError("Other error"), ErrorContext("other", "PATIENT123", "test"))
         
-        # Clear statistics
-        error_handler.clear_error_statistics()
         assert error_handler.get_error_statistics()["total_errors"] == 0
+        assert error_handler.error_callbacks == {}
+        assert OtherError not in error_handler._classification_cache
 
 class TestErrorHandlerDecorator:
     """Test error handler decorator."""
     
-    @pytest.fixture
-    def error_handler(self):
-        """Create error handler."""
-        return ErrorHandler()
-    
     def test_decorator_success(self, error_handler):
         """Test decorator with successful operation."""
         @handle_with_context("test_operation", "PATIENT123", "test_component", error_handler)
@@ -237,6 +324,18 @@ class TestErrorHandlerDecorator:
         result = successful_function()
         assert result == "success"
     
+    def test_decorator_preserves_metadata(self, error_handler):
+        """Test that decorated functions keep their metadata."""
+        decorator = handle_with_context("test_operation", "PATIENT123", "test_component", error_handler)
+        
+        @decorator
+        def documented_function():
+            """Documented function."""
+            return "success"
+        
+        assert documented_function.__name__ == "documented_function"
+        assert documented_function.__doc__ == "Documented function."
+    
     def test_decorator_recoverable_error(self, error_handler):
         """Test decorator with recoverable error."""
         @handle_with_context("test_operation", "PATIENT123", "test_component", error_handler)
@@ -270,31 +369,32 @@ class TestErrorHandlerDecorator:
 class TestErrorHandlerIntegration:
     """Test error handler integration scenarios."""
     
-    def test_multiple_error_types(self):
-        """Test handling multiple different error types."""
-        error_handler = ErrorHandler()
-        
-        errors = [
+    @pytest.mark.parametrize(
+        "error, component",
+        [
             (XMLParsingError("XML error"), "xml_parser"),
             (DataValidationError("Validation error"), "validator"),
             (ResearchError("Research error"), "research_searcher"),
             (ReportError("Report error"), "report_generator"),
             (S3Error("S3 error"), "s3_persister")
-        ]
+        ],
+        ids=["xml", "validation", "research", "report", "s3"]
+    )
+    def test_multiple_error_types(self, error, component):
+        """Test handling multiple different error types."""
+        error_handler = ErrorHandler()
         
-        for error, component in errors:
-            context = ErrorContext("test_operation", "PATIENT123", component)
-            result = error_handler.handle_error(error, context)
-            assert result["handled"] is True
+        context = ErrorContext("test_operation", "PATIENT123", component)
+        result = error_handler.handle_error(error, context)
+        assert result["handled"] is True
         
         stats = error_handler.get_error_statistics()
-        assert stats["total_errors"] == len(errors)
+        assert stats["total_errors"] == 1
     
     def test_error_handler_failure_recovery(self):
         """Test error handler's own error recovery."""
         # Create error handler with problematic audit logger
-        problematic_audit_logger = Mock()
-        problematic_audit_logger.log_error.side_effect = Exception("Audit logger failed")
+        problematic_audit_logger = _RaisingAuditLogger()
         
         error_handler = ErrorHandler(audit_logger=problematic_audit_logger)
         
@@ -304,22 +404,22 @@ class TestErrorHandlerIntegration:
         result = error_handler.handle_error(error, context)
         
         assert result["handled"] is True
+        assert result["severity"] == "medium"
+        assert error_handler.get_error_statistics()["total_errors"] == 1
     
-    @patch('src.utils.error_handler.logger')
-    def test_logging_integration(self, mock_logger):
+    def test_logging_integration(self, caplog):
         """Test integration with logging system."""
+        caplog.set_level(logging.ERROR, logger="src.utils.error_handler")
         error_handler = ErrorHandler()
         
         error = XMLParsingError("XML parsing failed")
         context = ErrorContext("xml_parsing", "PATIENT123", "xml_parser")
         error_handler.handle_error(error, context)
         
-        # Verify logging was called
-        mock_logger.error.assert_called()
-        
-        # Check log message format
-        call_args = mock_logger.error.call_args
-        log_message = call_args[0][0]
+        # Verify the error was logged with the expected message format
+        error_messages = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+        assert error_messages
+        log_message = error_messages[-1]
         assert "XMLParsingError" in log_message
         assert "Category: data" in log_message
-        assert "Severity: high" in log_message
\ No newline at end of file
+        assert "Severity: high" in log_message
@@ -0,0 +1,68 @@
+"""Performance regression tests for the error handling system."""
+import pytest
+import time
+
+from src.utils import error_handler as error_handler_module
+from src.utils.error_handler import ErrorHandler, ErrorContext
+from src.models.exceptions import DataValidationError, ResearchError, XMLParsingError
+
+ERROR_TYPES = (XMLParsingError, DataValidationError, ResearchError, ValueError, RuntimeError)
+
+# Workload size whose per-error cost the larger workloads are compared against
+BASELINE_ERROR_COUNT = 100
+
+# Allowed growth in per-error cost over the baseline (relative, so machine load cancels out)
+MAX_PER_ERROR_SLOWDOWN = 3.0
+
+def _build_workload(error_count):
+    """Build the errors and their contexts ahead of timing."""
+    return [
+        (
+            ERROR_TYPES[i % len(ERROR_TYPES)](f"Error {i}"),
+            ErrorContext(f"operation_{i % 10}", f"PATIENT{i % 50:03d}", "perf_test")
+        )
+        for i in range(error_count)
+    ]
+
+def _time_handle_errors(error_handler, workload, repeats=1):
+    """Return the best elapsed time in seconds for handling every error in the workload."""
+    handle_error = error_handler.handle_error
+    best = float("inf")
+    for _ in range(repeats):
+        error_handler.clear_error_statistics()
+        start_time = time.perf_counter()
+        for error, context in workload:
+            handle_error(error, context)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+@pytest.fixture(autouse=True)
+def silence_error_logging(monkeypatch):
+    """Keep the timed records out of whatever root handlers earlier tests installed."""
+    monkeypatch.setattr(error_handler_module.logger, "disabled", True)
+
+@pytest.fixture
+def error_handler(stub_audit_logger):
+    """Create an error handler whose classification cache is already warm."""
+    handler = ErrorHandler(audit_logger=stub_audit_logger)
+    for error, context in _build_workload(len(ERROR_TYPES)):
+        handler.handle_error(error, context)
+    handler.clear_error_statistics()
+    stub_audit_logger.log_error.reset_mock()
+    return handler
+
+class TestErrorHandlingPerformance:
+    """Error handling throughput regression tests."""
+    
+    @pytest.mark.performance
+    @pytest.mark.parametrize("error_count", [1_000, 10_000])
+    def test_handle_error_cost_does_not_grow(self, error_handler, stub_audit_logger, error_count):
+        """Test that the per-error cost of handle_error stays flat as the error count grows."""
+        baseline = _time_handle_errors(error_handler, _build_workload(BASELINE_ERROR_COUNT), repeats=3)
+        stub_audit_logger.log_error.reset_mock()
+        
+        elapsed = _time_handle_errors(error_handler, _build_workload(error_count))
+        
+        assert error_handler.get_error_statistics()["total_errors"] == error_count
+        assert stub_audit_logger.log_error.call_count == error_count
+        assert elapsed / error_count <= baseline / BASELINE_ERROR_COUNT * MAX_PER_ERROR_SLOWDOWN
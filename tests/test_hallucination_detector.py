@@ -2,7 +2,9 @@
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime
+from types import SimpleNamespace
 
+from src.quality import hallucination_detector
 from src.quality.hallucination_detector import (
     HallucinationDetector, MedicalTerminologyValidator,
     ValidationIssue, ValidationSeverity, ValidationType
@@ -47,6 +49,22 @@ class TestMedicalTerminologyValidator:
             assert is_valid, f"'{variation}' should be valid"
             assert confidence >= 0.8, f"'{variation}' should have high confidence"
     
+    def test_validate_condition_terminology_variation_skips_fuzzy_match(self, validator):
+        """Test known variations resolve from the index without fuzzy matching."""
+        with patch("src.quality.hallucination_detector.difflib.SequenceMatcher") as matcher:
+            is_valid, confidence, suggestions = validator.validate_condition_terminology("  COPD ")
+        
+        matcher.assert_not_called()
+        assert is_valid
+        assert confidence == 0.9
+        assert suggestions == ["Consider using standard term: chronic obstructive pulmonary disease"]
+    
+    def test_validate_terminology_normalizes_punctuation_and_spacing(self, validator):
+        """Test that punctuation and repeated whitespace do not defeat exact matches."""
+        assert validator.validate_condition_terminology("Myocardial   Infarction.") == (True, 1.0, [])
+        assert validator.validate_condition_terminology("A-Fib")[:2] == (True, 0.9)
+        assert validator.validate_medication_name("Lisinopril,") == (True, 1.0, [])
+    
     def test_validate_condition_terminology_invalid(self, validator):
         """Test validation of invalid conditions."""
         invalid_conditions = [
@@ -93,6 +111,15 @@ class TestMedicalTerminologyValidator:
             # Should be recognized by pattern even if not in dictionary
             assert confidence >= 0.5, f"'{medication}' should be recognized by pattern"
     
+    def test_validate_medication_name_partial_and_unknown(self, validator):
+        """Test partial matches report their category and punctuation-only names are rejected."""
+        assert validator.validate_medication_name("metoprolol succinate") == (
+            True, 0.8, ["Possible match in beta blockers: metoprolol"]
+        )
+        assert validator.validate_medication_name("erythromycin")[:2] == (True, 0.7)
+        assert validator.validate_medication_name("...") == (False, 0.0, ["Medication name cannot be empty"])
+        assert validator.validate_medication_name("xyzzy")[:2] == (False, 0.0)
+    
     def test_validate_icd_code_valid(self, validator):
         """Test validation of valid ICD-10 codes."""
         valid_codes = [
@@ -170,6 +197,30 @@ class TestValidationIssue:
         assert issue_dict["severity"] == "error"
         assert issue_dict["description"] == "Test issue"
         assert issue_dict["field_name"] == "test_field"
+    
+    def test_validation_issue_uses_slots(self):
+        """Test that validation issues carry no per-instance __dict__."""
+        issue = ValidationIssue(
+            issue_id="TEST_001",
+            validation_type=ValidationType.ACCURACY,
+            severity=ValidationSeverity.INFO,
+            description="Test issue",
+            field_name="test_field"
+        )
+        
+        assert not hasattr(issue, "__dict__")
+        assert issue.suggestions == []
+    
+    def test_validation_issue_interns_field_name(self):
+        """Test that equal field names built at runtime share one string object."""
+        issues = [
+            ValidationIssue("TEST_%03d" % i, ValidationType.ACCURACY, ValidationSeverity.INFO,
+                            "Test issue", "".join(["conditions[", str(i % 2), "].name"]))
+            for i in range(4)
+        ]
+        
+        assert issues[0].field_name is issues[2].field_name
+        assert issues[1].field_name is issues[3].field_name
 
 
 class TestHallucinationDetector:
@@ -192,6 +243,10 @@ class TestHallucinationDetector:
         assert isinstance(detector.validation_issues, list)
         assert len(detector.confidence_thresholds) == 4
     
+    def test_detectors_share_terminology_validator(self, detector):
+        """Test the read-only terminology validator is built once and shared."""
+        assert HallucinationDetector().terminology_validator is detector.terminology_validator
+    
     def test_validate_against_source_basic(self, detector):
         """Test basic source validation."""
         extracted_data = {
@@ -244,6 +299,36 @@ class TestHallucinationDetector:
         name_issues = [issue for issue in issues if "name" in issue.field_name.lower()]
         assert len(name_issues) > 0, "Should detect name mismatch"
     
+    def test_validate_against_source_name_variations(self, detector):
+        """Test reordered, re-cased or abbreviated names are not reported as mismatches."""
+        source_xml = '<patient name="John A. Smith" id="PAT123"></patient>'
+        
+        for extracted_name in ("John Smith", "SMITH, JOHN A.", "Jon Smith"):
+            issues = detector.validate_against_source(
+                {"patient_data": {"name": extracted_name}}, source_xml, "PAT123"
+            )
+            assert not [i for i in issues if i.field_name == "patient_name"], extracted_name
+        
+        issues = detector.validate_against_source(
+            {"patient_data": {"name": "Mary Jones"}}, source_xml, "PAT123"
+        )
+        name_issues = [i for i in issues if i.field_name == "patient_name"]
+        assert len(name_issues) == 1
+        assert name_issues[0].expected_value == "John A. Smith"
+    
+    @pytest.mark.parametrize("extracted_name", ["Smith", "John", "SMITH"])
+    def test_validate_against_source_single_token_name_mismatch(self, detector, extracted_name):
+        """Test a lone first name or surname is not accepted as the full patient name."""
+        source_xml = '<patient name="John Smith" id="PAT123"></patient>'
+        
+        issues = detector.validate_against_source(
+            {"patient_data": {"name": extracted_name}}, source_xml, "PAT123"
+        )
+        
+        name_issues = [i for i in issues if i.field_name == "patient_name"]
+        assert len(name_issues) == 1
+        assert name_issues[0].confidence_score < 0.8
+    
     def test_validate_analysis_completeness_complete(self, detector):
         """Test completeness validation with complete data."""
         complete_data = {
@@ -351,6 +436,35 @@ class TestHallucinationDetector:
         confidence_issues = [issue for issue in issues if "confidence" in issue.field_name]
         assert len(confidence_issues) > 0, "Should detect low analysis confidence"
     
+    def test_validate_research_accuracy_multiple_findings(self, detector):
+        """Test research accuracy validation across several findings."""
+        research_analysis = SimpleNamespace(
+            research_findings=[
+                {"title": "Study A", "authors": ["Smith, J."], "journal": "Journal", "publication_year": 2020},
+                {"title": "Study B", "authors": ["Doe, J."], "journal": "Journal", "publication_year": 1850},
+                {"title": "Study C", "authors": [], "journal": "Journal", "publication_year": 2021},
+                "not a finding"
+            ],
+            analysis_confidence=0.8
+        )
+        
+        issues = detector.validate_research_accuracy(research_analysis)
+        
+        assert sorted(issue.field_name for issue in issues) == [
+            "research_findings[1].publication_year",
+            "research_findings[2].authors"
+        ]
+    
+    def test_current_year_is_cached_per_hour(self):
+        """Test the current year is read from the clock once per hour bucket."""
+        hallucination_detector._current_year_for_hour.cache_clear()
+        with patch.object(hallucination_detector.time, "time", return_value=7200.5):
+            assert hallucination_detector._current_year() == datetime.now().year
+            assert hallucination_detector._current_year() == datetime.now().year
+        
+        info = hallucination_detector._current_year_for_hour.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+    
     def test_generate_validation_report_no_issues(self, detector):
         """Test validation report generation with no issues."""
         issues = []
@@ -396,6 +510,9 @@ class TestHallucinationDetector:
         assert len(report["issues_by_severity"]) > 0
         assert len(report["issues_by_type"]) > 0
         assert len(report["recommendations"]) > 0
+        assert type(report["issues_by_severity"]) is dict
+        assert [i["issue_id"] for i in report["issues_by_severity"]["error"]] == ["TEST_002"]
+        assert [i["issue_id"] for i in report["issues_by_type"]["accuracy"]] == ["TEST_003"]
     
     def test_determine_severity(self, detector):
         """Test severity determination based on confidence scores."""
@@ -405,6 +522,26 @@ class TestHallucinationDetector:
         assert detector._determine_severity(0.6) == ValidationSeverity.WARNING
         assert detector._determine_severity(0.9) == ValidationSeverity.INFO
     
+    def test_determine_severity_boundaries(self, detector):
+        """Test thresholds are exclusive upper bounds."""
+        scores = [0.0, 0.3, 0.5, 0.7, 1.0]
+        expected = [
+            ValidationSeverity.CRITICAL,
+            ValidationSeverity.ERROR,
+            ValidationSeverity.WARNING,
+            ValidationSeverity.INFO,
+            ValidationSeverity.INFO,
+        ]
+        
+        assert [detector._determine_severity(s) for s in scores] == expected
+    
+    def test_determine_severity_follows_threshold_changes(self, detector):
+        """Test severities use the current thresholds rather than those at construction."""
+        detector.confidence_thresholds['warning'] = 0.8
+        
+        assert detector._determine_severity(0.75) == ValidationSeverity.WARNING
+        assert detector._determine_severity(0.8) == ValidationSeverity.INFO
+    
     def test_condition_in_source(self, detector):
         """Test condition presence detection in source XML."""
         source_xml = """
@@ -441,6 +578,10 @@ class TestHallucinationDetector:
         assert "issues_by_severity" in stats
         assert "issues_by_type" in stats
         assert stats["total_validations"] == 2
+        assert stats["issues_by_severity"] == {"info": 0, "warning": 1, "error": 1, "critical": 0}
+        assert stats["issues_by_type"]["medical_terminology"] == 1
+        assert stats["issues_by_type"]["completeness"] == 0
+        assert len(stats["issues_by_type"]) == len(ValidationType)
 
 
 class TestHallucinationDetectorIntegration:
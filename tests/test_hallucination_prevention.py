@@ -1,26 +1,28 @@
 """Tests for hallucination prevention system."""
+import re
 import pytest
 from unittest.mock import Mock, patch
 
 from src.utils.hallucination_prevention import (
-    HallucinationPreventionSystem, MedicalKnowledgeValidator,
-    HallucinationRiskLevel, HallucinationCheck,
+    HallucinationPreventionSystem, MedicalKnowledgeValidator, PreventionStatistics,
+    HallucinationRiskLevel, HallucinationCheck, _HALLUCINATION_INDICATOR_PATTERNS,
     initialize_hallucination_prevention, get_hallucination_prevention_system
 )
 from src.models.exceptions import HallucinationDetectedError
 from src.utils.audit_logger import AuditLogger
 from src.utils.error_handler import ErrorHandler
 
+@pytest.fixture(scope="module")
+def validator():
+    """Medical knowledge validator shared by the module (read-only during tests)."""
+    return MedicalKnowledgeValidator()
+
 class TestMedicalKnowledgeValidator:
     """Test cases for MedicalKnowledgeValidator."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = MedicalKnowledgeValidator()
-    
-    def test_load_medical_terms(self):
+    def test_load_medical_terms(self, validator):
         """Test loading of medical terms."""
-        terms = self.validator._load_medical_terms()
+        terms = validator._load_medical_terms()
         
         assert isinstance(terms, set)
         assert len(terms) > 0
@@ -28,9 +30,9 @@ class TestMedicalKnowledgeValidator:
         assert 'diabetes' in terms
         assert 'cardiology' in terms
     
-    def test_load_drug_names(self):
+    def test_load_drug_names(self, validator):
         """Test loading of drug names."""
-        drugs = self.validator._load_drug_names()
+        drugs = validator._load_drug_names()
         
         assert isinstance(drugs, set)
         assert len(drugs) > 0
@@ -38,204 +40,253 @@ class TestMedicalKnowledgeValidator:
         assert 'metformin' in drugs
         assert 'lisinopril' in drugs
     
-    def test_validate_clean_medical_content(self):
+    def test_validate_clean_medical_content(self, validator):
         """Test validation of clean medical content."""
         content = "Patient diagnosed with hypertension and prescribed lisinopril 10mg daily."
         
-        result = self.validator.validate_medical_content(content, "general")
+        result = validator.validate_medical_content(content, "general")
         
         assert result.risk_level == HallucinationRiskLevel.MINIMAL
         assert result.confidence > 0.8
         assert len(result.detected_patterns) == 0
         assert not result.requires_human_review
     
-    def test_validate_suspicious_content(self):
-        """Test validation of content with suspicious patterns."""
-        content = "Patient has fictional disease from Star Wars universe with magical healing."
-        
-        result = self.validator.validate_medical_content(content, "general")
+    @pytest.mark.parametrize("content,content_type,allowed_levels,min_confidence", [
+        pytest.param("Patient prescribed aspirin 81mg daily and metformin 500mg twice daily.", "medication",
+                     [HallucinationRiskLevel.MINIMAL, HallucinationRiskLevel.LOW], 0.7,
+                     id="medication_known_drugs"),
+        pytest.param("Patient has type 2 diabetes mellitus and essential hypertension.", "condition",
+                     [HallucinationRiskLevel.MINIMAL], 0.8,
+                     id="condition_known_conditions"),
+        pytest.param("Patient underwent coronary angioplasty and echocardiogram.", "procedure",
+                     [HallucinationRiskLevel.MINIMAL], 0.7,
+                     id="procedure_known_procedures"),
+    ])
+    def test_validate_recognized_content(self, validator, content, content_type,
+                                         allowed_levels, min_confidence):
+        """Test validation of content built from recognized medical terminology."""
+        result = validator.validate_medical_content(content, content_type)
+        
+        assert result.risk_level in allowed_levels
+        assert result.confidence > min_confidence
+    
+    @pytest.mark.parametrize("content,content_type,expected_pattern", [
+        pytest.param("Patient has fictional disease from Star Wars universe with magical healing.", "general",
+                     "Suspicious pattern",
+                     id="suspicious_content"),
+        pytest.param("Patient prescribed aspirin 15000mg daily.", "medication",  # Extremely high dose
+                     "Unusually high dosage",
+                     id="medication_high_dosage"),
+        pytest.param("Patient has some unknown mysterious ailment that affects their wellbeing.", "condition",
+                     "No recognized medical conditions",
+                     id="condition_no_recognized_conditions"),
+        pytest.param("Patient is completely asymptomatic but has severe chronic symptoms.", "condition",
+                     "Contradiction detected",
+                     id="condition_contradictory"),
+        pytest.param("Patient had outpatient major surgery with minimally invasive open surgery.", "procedure",
+                     "Impossible combination",
+                     id="procedure_impossible_combinations"),
+        pytest.param("The patient went to the store and bought some things for their house and family.", "general",
+                     "Low medical terminology density",
+                     id="general_low_medical_density"),
+        pytest.param("Patient had pediatric condition but is also geriatric patient.", "general",
+                     "Temporal inconsistency",
+                     id="logical_consistency_temporal"),
+    ])
+    def test_validate_flagged_content(self, validator, content, content_type, expected_pattern):
+        """Test validation flags suspicious, unknown or inconsistent content."""
+        result = validator.validate_medical_content(content, content_type)
         
         assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert result.confidence < 0.8
-        assert len(result.detected_patterns) > 0
-        assert any("Suspicious pattern" in pattern for pattern in result.detected_patterns)
+        assert any(expected_pattern in pattern for pattern in result.detected_patterns)
     
-    def test_validate_medication_known_drugs(self):
-        """Test validation of content with known medications."""
-        content = "Patient prescribed aspirin 81mg daily and metformin 500mg twice daily."
+    def test_validate_suspicious_content_confidence(self, validator):
+        """Test suspicious patterns lower the validation confidence."""
+        content = "Patient has fictional disease from Star Wars universe with magical healing."
         
-        result = self.validator.validate_medical_content(content, "medication")
+        result = validator.validate_medical_content(content, "general")
         
-        assert result.risk_level in [HallucinationRiskLevel.MINIMAL, HallucinationRiskLevel.LOW]
-        assert result.confidence > 0.7
+        assert result.confidence < 0.8
     
-    def test_validate_medication_unknown_drugs(self):
+    def test_validate_medication_unknown_drugs(self, validator):
         """Test validation of content with unknown medications."""
         content = "Patient prescribed fictionaldrugxyz 100mg and imaginarymedicine 50mg daily."
         
-        result = self.validator.validate_medical_content(content, "medication")
+        result = validator.validate_medical_content(content, "medication")
         
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
         assert any("Unknown medications" in pattern for pattern in result.detected_patterns)
         assert len(result.suggested_corrections) > 0
     
-    def test_validate_medication_high_dosage(self):
-        """Test validation of medications with unusually high dosages."""
-        content = "Patient prescribed aspirin 15000mg daily."  # Extremely high dose
-        
-        result = self.validator.validate_medical_content(content, "medication")
-        
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert any("high dosage" in pattern.lower() for pattern in result.detected_patterns)
-    
-    def test_validate_condition_known_conditions(self):
-        """Test validation of content with known medical conditions."""
-        content = "Patient has type 2 diabetes mellitus and essential hypertension."
+    def test_validate_medication_looks_up_each_word_once(self):
+        """Test repeated words are looked up once per call and unknown words keep their order."""
+        validator = MedicalKnowledgeValidator()
+        content = "Patient takes zorbexal daily, amoxicillinate daily and zorbexal nightly."
         
-        result = self.validator.validate_medical_content(content, "condition")
+        with patch.object(validator, "_word_matches_known_drug",
+                          wraps=validator._word_matches_known_drug) as matches_known_drug:
+            result = validator.validate_medical_content(content, "medication")
         
-        assert result.risk_level == HallucinationRiskLevel.MINIMAL
-        assert result.confidence > 0.8
-    
-    def test_validate_condition_no_recognized_conditions(self):
-        """Test validation of condition content with no recognized conditions."""
-        content = "Patient has some unknown mysterious ailment that affects their wellbeing."
-        
-        result = self.validator.validate_medical_content(content, "condition")
-        
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert any("No recognized medical conditions" in pattern for pattern in result.detected_patterns)
-    
-    def test_validate_condition_contradictory(self):
-        """Test validation of contradictory condition statements."""
-        content = "Patient is completely asymptomatic but has severe chronic symptoms."
-        
-        result = self.validator.validate_medical_content(content, "condition")
-        
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert any("Contradiction detected" in pattern for pattern in result.detected_patterns)
-    
-    def test_validate_procedure_known_procedures(self):
-        """Test validation of content with known procedures."""
-        content = "Patient underwent coronary angioplasty and echocardiogram."
-        
-        result = self.validator.validate_medical_content(content, "procedure")
-        
-        assert result.risk_level == HallucinationRiskLevel.MINIMAL
-        assert result.confidence > 0.7
-    
-    def test_validate_procedure_impossible_combinations(self):
-        """Test validation of impossible procedure combinations."""
-        content = "Patient had outpatient major surgery with minimally invasive open surgery."
-        
-        result = self.validator.validate_medical_content(content, "procedure")
-        
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert any("Impossible combination" in pattern for pattern in result.detected_patterns)
+        assert "Unknown medications: patient, takes, zorbexal" in result.detected_patterns
+        assert matches_known_drug.call_count == 6  # "daily" and "zorbexal" are looked up once
+        assert validator._word_matches_known_drug("amoxicillinate")
     
-    def test_validate_general_low_medical_density(self):
-        """Test validation of general content with low medical term density."""
-        content = "The patient went to the store and bought some things for their house and family."
+    def test_validate_general_density_threshold(self, validator):
+        """Test the density check flags content just below 10% known terms only."""
+        filler = " ".join(["word"] * 27)
         
-        result = self.validator.validate_medical_content(content, "general")
+        at_threshold = validator.validate_medical_content(f"fever cough fatigue {filler}", "general")
+        below_threshold = validator.validate_medical_content(f"fever cough {filler} word", "general")
         
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert any("Low medical terminology density" in pattern for pattern in result.detected_patterns)
+        assert "Low medical terminology density" not in at_threshold.detected_patterns
+        assert "Low medical terminology density" in below_threshold.detected_patterns
     
-    def test_validate_medical_codes_valid_icd(self):
+    def test_validate_medical_codes_valid_icd(self, validator):
         """Test validation of valid ICD codes."""
         content = "Patient diagnosed with E11.9 (Type 2 diabetes without complications)."
         
-        result = self.validator.validate_medical_content(content, "general")
+        result = validator.validate_medical_content(content, "general")
         
         # Should not flag valid ICD codes
         code_issues = [p for p in result.detected_patterns if "Invalid ICD code" in p]
         assert len(code_issues) == 0
     
-    def test_validate_medical_codes_invalid_icd(self):
+    def test_validate_medical_codes_invalid_icd(self, validator):
         """Test validation of invalid ICD codes."""
         content = "Patient diagnosed with XYZ123 (invalid code format)."
         
-        result = self.validator.validate_medical_content(content, "general")
+        result = validator.validate_medical_content(content, "general")
         
         assert any("Invalid ICD code format" in pattern for pattern in result.detected_patterns)
     
-    def test_validate_logical_consistency_temporal(self):
-        """Test validation of temporal logical consistency."""
-        content = "Patient had pediatric condition but is also geriatric patient."
-        
-        result = self.validator.validate_medical_content(content, "general")
-        
-        assert result.risk_level != HallucinationRiskLevel.MINIMAL
-        assert any("Temporal inconsistency" in pattern for pattern in result.detected_patterns)
-    
-    def test_validate_empty_content(self):
+    def test_validate_empty_content(self, validator):
         """Test validation of empty content."""
         content = ""
         
-        result = self.validator.validate_medical_content(content, "general")
+        result = validator.validate_medical_content(content, "general")
         
         assert result.risk_level == HallucinationRiskLevel.MINIMAL
         assert result.confidence == 1.0
         assert len(result.detected_patterns) == 0
+    
+    def test_indicator_scan_matches_individual_indicators(self, validator):
+        """Test the fused indicator scan reports what each indicator finds on its own."""
+        content = ("Fake disease noted in sample chart; Harry Potter fan with magical healing, "
+                   "a robotic heart and a dummy test result. Another fake disease from Disney.")
+        
+        expected = [
+            set(matches)
+            for matches in (
+                re.findall(r'\b' + pattern, content, re.IGNORECASE)
+                for pattern in _HALLUCINATION_INDICATOR_PATTERNS
+            )
+            if matches
+        ]
+        result = validator.validate_medical_content(content, "general")
+        reported = [
+            set(p[len("Suspicious pattern: "):].split(", "))
+            for p in result.detected_patterns if p.startswith("Suspicious pattern: ")
+        ]
+        
+        assert reported == expected
+        assert len(reported) == 5
+    
+    def test_validate_blank_content(self):
+        """Test empty and whitespace-only content return a minimal-risk result."""
+        validator = MedicalKnowledgeValidator()
+        
+        for content in ("", "   \n\t"):
+            result = validator.validate_medical_content(content, "condition")
+            assert result.risk_level == HallucinationRiskLevel.MINIMAL
+            assert result.confidence == 1.0
+            assert result.detected_patterns == []
+    
+    def test_validate_repeated_content_returns_independent_results(self):
+        """Test repeated content is revalidated and results do not share state."""
+        validator = MedicalKnowledgeValidator()
+        content = "Patient has fictional disease from Star Wars universe with magical healing."
+        
+        first = validator.validate_medical_content(content, "general")
+        first.detected_patterns.append("mutated by caller")
+        second = validator.validate_medical_content(content, "general")
+        
+        assert "mutated by caller" not in second.detected_patterns
+        assert second.risk_level == first.risk_level
+
+@pytest.fixture(scope="module")
+def prevention_audit_logger():
+    """Mock audit logger shared by the prevention system tests."""
+    return Mock(spec=AuditLogger)
+
+@pytest.fixture(scope="module")
+def prevention_error_handler():
+    """Mock error handler shared by the prevention system tests."""
+    return Mock(spec=ErrorHandler)
+
+@pytest.fixture(scope="module")
+def shared_strict_system(prevention_audit_logger, prevention_error_handler):
+    """Strict prevention system shared by the prevention system tests."""
+    return HallucinationPreventionSystem(
+        audit_logger=prevention_audit_logger,
+        error_handler=prevention_error_handler,
+        strict_mode=True
+    )
+
+@pytest.fixture
+def strict_system(shared_strict_system, prevention_audit_logger, prevention_error_handler):
+    """Shared strict prevention system with mocks and statistics reset for each test."""
+    # reset_mock() alone keeps configured return values and side effects
+    prevention_audit_logger.reset_mock(return_value=True, side_effect=True)
+    prevention_error_handler.reset_mock(return_value=True, side_effect=True)
+    shared_strict_system.reset_statistics()
+    return shared_strict_system
 
 class TestHallucinationPreventionSystem:
     """Test cases for HallucinationPreventionSystem."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.audit_logger = Mock(spec=AuditLogger)
-        self.error_handler = Mock(spec=ErrorHandler)
-        self.system = HallucinationPreventionSystem(
-            audit_logger=self.audit_logger,
-            error_handler=self.error_handler,
-            strict_mode=True
-        )
-    
-    def test_initialization(self):
+    def test_initialization(self, strict_system, prevention_audit_logger, prevention_error_handler):
         """Test system initialization."""
-        assert self.system.audit_logger is self.audit_logger
-        assert self.system.error_handler is self.error_handler
-        assert self.system.strict_mode is True
-        assert self.system.medical_validator is not None
-        assert self.system.prevention_stats["total_checks"] == 0
+        assert strict_system.audit_logger is prevention_audit_logger
+        assert strict_system.error_handler is prevention_error_handler
+        assert strict_system.strict_mode is True
+        assert strict_system.medical_validator is not None
+        assert strict_system.get_prevention_statistics()["total_checks"] == 0
     
-    def test_check_content_safe(self):
+    def test_check_content_safe(self, strict_system):
         """Test checking safe medical content."""
         content = "Patient has well-controlled diabetes and hypertension."
         
-        result = self.system.check_content(content, "general", "P12345")
+        result = strict_system.check_content(content, "general", "P12345")
         
         assert result.risk_level == HallucinationRiskLevel.MINIMAL
         assert not result.requires_human_review
-        assert self.system.prevention_stats["total_checks"] == 1
-        assert self.system.prevention_stats["by_risk_level"]["minimal"] == 1
+        assert strict_system.get_prevention_statistics()["total_checks"] == 1
+        assert strict_system.get_prevention_statistics()["by_risk_level"]["minimal"] == 1
     
-    def test_check_content_medium_risk(self):
+    def test_check_content_medium_risk(self, strict_system):
         """Test checking medium-risk content."""
         content = "Patient has some unknown condition with placeholder symptoms."
         
-        result = self.system.check_content(content, "general", "P12345")
+        result = strict_system.check_content(content, "general", "P12345")
         
         assert result.risk_level in [HallucinationRiskLevel.LOW, HallucinationRiskLevel.MEDIUM]
         assert len(result.detected_patterns) > 0
-        assert self.system.prevention_stats["total_checks"] == 1
+        assert strict_system.get_prevention_statistics()["total_checks"] == 1
     
-    def test_check_content_high_risk_strict_mode(self):
+    def test_check_content_high_risk_strict_mode(self, strict_system, prevention_audit_logger):
         """Test checking high-risk content in strict mode."""
         content = "Patient has fictional magical disease from Harry Potter with supernatural healing powers."
         
         # Should not raise exception for HIGH risk, only CRITICAL
-        result = self.system.check_content(content, "general", "P12345")
+        result = strict_system.check_content(content, "general", "P12345")
         
         assert result.risk_level in [HallucinationRiskLevel.HIGH, HallucinationRiskLevel.MEDIUM]
         assert result.requires_human_review or result.risk_level == HallucinationRiskLevel.MEDIUM
         
         # Should log the detection
         if result.risk_level == HallucinationRiskLevel.HIGH:
-            assert self.audit_logger.log_system_event.called
+            assert prevention_audit_logger.log_system_event.called
     
-    def test_check_content_critical_risk_strict_mode(self):
+    def test_check_content_critical_risk_strict_mode(self, strict_system, prevention_audit_logger):
         """Test checking critical-risk content in strict mode."""
         # Create content that will definitely trigger critical risk
         content = ("Patient has fictional imaginary made-up disease from Star Wars "
@@ -243,11 +294,11 @@ class TestHallucinationPreventionSystem:
                   "treated with placeholder dummy medications.")
         
         with pytest.raises(HallucinationDetectedError) as exc_info:
-            self.system.check_content(content, "general", "P12345")
+            strict_system.check_content(content, "general", "P12345")
         
         assert "Critical hallucination risk detected" in str(exc_info.value)
-        assert self.system.prevention_stats["high_risk_blocked"] == 1
-        assert self.audit_logger.log_system_event.called
+        assert strict_system.get_prevention_statistics()["high_risk_blocked"] == 1
+        assert prevention_audit_logger.log_system_event.called
     
     def test_check_content_non_strict_mode(self):
         """Test checking critical content in non-strict mode."""
@@ -261,29 +312,29 @@ class TestHallucinationPreventionSystem:
         assert result.risk_level in [HallucinationRiskLevel.HIGH, HallucinationRiskLevel.CRITICAL]
         assert len(result.detected_patterns) > 0
     
-    def test_check_content_with_patient_context(self):
+    def test_check_content_with_patient_context(self, strict_system):
         """Test checking content with patient context."""
         content = "Patient diagnosed with hypertension."
         patient_id = "P12345"
         
-        result = self.system.check_content(content, "condition", patient_id, "diagnosis_validation")
+        result = strict_system.check_content(content, "condition", patient_id, "diagnosis_validation")
         
         assert result.risk_level == HallucinationRiskLevel.MINIMAL
         # Verify the operation was logged with correct context
         # (This would be verified through the log_operation context manager)
     
-    def test_prevention_statistics_tracking(self):
+    def test_prevention_statistics_tracking(self, strict_system):
         """Test prevention statistics tracking."""
         # Check various types of content
-        self.system.check_content("Normal medical content", "general")
-        self.system.check_content("Patient has some unknown symptoms", "general")
+        strict_system.check_content("Normal medical content", "general")
+        strict_system.check_content("Patient has some unknown symptoms", "general")
         
         try:
-            self.system.check_content("Fictional magical disease", "general")
+            strict_system.check_content("Fictional magical disease", "general")
         except HallucinationDetectedError:
             pass  # Expected in strict mode
         
-        stats = self.system.get_prevention_statistics()
+        stats = strict_system.get_prevention_statistics()
         
         assert stats["total_checks"] >= 2
         assert "hallucination_rate" in stats
@@ -297,28 +348,51 @@ class TestHallucinationPreventionSystem:
             assert 0.0 <= stats["human_review_rate"] <= 1.0
             assert 0.0 <= stats["block_rate"] <= 1.0
     
-    def test_prevention_statistics_empty(self):
+    def test_reset_statistics(self, strict_system):
+        """Test statistics reset clears all counters."""
+        strict_system.check_content("Patient diagnosed with hypertension.", "condition")
+        
+        strict_system.reset_statistics()
+        
+        stats = strict_system.get_prevention_statistics()
+        assert stats["total_checks"] == 0
+        assert set(stats["by_risk_level"].values()) == {0}
+    
+    def test_prevention_statistics_are_snapshots(self, strict_system):
+        """Test counters live in a slotted record and reported dicts are independent copies."""
+        strict_system.check_content("Patient has well-controlled diabetes and hypertension.", "general")
+        
+        stats = strict_system.get_prevention_statistics()
+        stats["by_risk_level"]["minimal"] = 99
+        
+        assert isinstance(strict_system.statistics, PreventionStatistics)
+        assert not hasattr(strict_system.statistics, "__dict__")
+        assert strict_system.get_prevention_statistics()["by_risk_level"] == {
+            "minimal": 1, "low": 0, "medium": 0, "high": 0, "critical": 0
+        }
+    
+    def test_prevention_statistics_empty(self, strict_system):
         """Test prevention statistics when no checks performed."""
-        stats = self.system.get_prevention_statistics()
+        stats = strict_system.get_prevention_statistics()
         
         assert stats["total_checks"] == 0
         assert stats["hallucination_rate"] == 0.0
         assert stats["human_review_rate"] == 0.0
         assert stats["block_rate"] == 0.0
     
-    def test_error_handling_integration(self):
+    def test_error_handling_integration(self, strict_system, prevention_error_handler):
         """Test integration with error handler."""
         content = ("Patient has fictional imaginary made-up disease from Star Wars "
                   "with magical supernatural healing powers.")
         
         with pytest.raises(HallucinationDetectedError):
-            self.system.check_content(content, "general", "P12345")
+            strict_system.check_content(content, "general", "P12345")
         
         # Verify error handler was called
-        assert self.error_handler.handle_error.called
+        assert prevention_error_handler.handle_error.called
         
         # Verify error context
-        call_args = self.error_handler.handle_error.call_args
+        call_args = prevention_error_handler.handle_error.call_args
         error, context = call_args[0]
         
         assert isinstance(error, HallucinationDetectedError)
@@ -326,6 +400,17 @@ class TestHallucinationPreventionSystem:
         assert context.component == "hallucination_prevention"
         assert context.patient_id == "P12345"
 
+@pytest.fixture(scope="module")
+def shared_integration_system():
+    """Non-strict prevention system shared by the integration tests."""
+    return initialize_hallucination_prevention(strict_mode=False)
+
+@pytest.fixture
+def integration_system(shared_integration_system):
+    """Shared non-strict prevention system with statistics reset for each test."""
+    shared_integration_system.reset_statistics()
+    return shared_integration_system
+
 class TestHallucinationPreventionIntegration:
     """Integration tests for hallucination prevention system."""
     
@@ -355,9 +440,9 @@ class TestHallucinationPreventionIntegration:
         assert system.error_handler is None
         assert system.strict_mode is True
     
-    def test_multiple_content_types(self):
+    def test_multiple_content_types(self, integration_system):
         """Test checking multiple content types."""
-        system = initialize_hallucination_prevention(strict_mode=False)
+        system = integration_system
         
         test_contents = {
             "medication": "Patient prescribed aspirin 81mg and metformin 500mg daily.",
@@ -375,9 +460,9 @@ class TestHallucinationPreventionIntegration:
             assert result.risk_level in [HallucinationRiskLevel.MINIMAL, HallucinationRiskLevel.LOW]
             assert result.confidence > 0.6
     
-    def test_progressive_risk_detection(self):
+    def test_progressive_risk_detection(self, integration_system):
         """Test progressive risk detection with increasingly suspicious content."""
-        system = initialize_hallucination_prevention(strict_mode=False)
+        system = integration_system
         
         test_cases = [
             ("Clean medical content", "Patient has diabetes and hypertension."),
@@ -399,9 +484,9 @@ class TestHallucinationPreventionIntegration:
             if "magical supernatural" in content:
                 assert result.risk_level in [HallucinationRiskLevel.HIGH, HallucinationRiskLevel.CRITICAL]
     
-    def test_content_type_specific_validation(self):
+    def test_content_type_specific_validation(self, integration_system):
         """Test that content type affects validation appropriately."""
-        system = initialize_hallucination_prevention(strict_mode=False)
+        system = integration_system
         
         # Same suspicious content, different types
         content = "Patient has unknown fictionalname condition."
@@ -415,9 +500,9 @@ class TestHallucinationPreventionIntegration:
         assert all(r.risk_level != HallucinationRiskLevel.MINIMAL 
                   for r in [general_result, condition_result, medication_result])
     
-    def test_statistics_aggregation(self):
+    def test_statistics_aggregation(self, integration_system):
         """Test statistics aggregation across multiple checks."""
-        system = initialize_hallucination_prevention(strict_mode=False)
+        system = integration_system
         
         # Perform various checks
         test_contents = [
@@ -1,6 +1,8 @@
 """Comprehensive integration tests with anonymized sample patient data."""
 import pytest
 import asyncio
+import copy
+import re
 import time
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
@@ -12,42 +14,59 @@ from src.agents.medical_summarization_agent import MedicalSummarizationAgent
 from src.agents.research_correlation_agent import ResearchCorrelationAgent
 from src.agents.report_generator import ReportGenerator
 from src.agents.s3_report_persister import S3ReportPersister
-from src.models import PatientData, MedicalSummary, ResearchAnalysis, AnalysisReport
+from src.models import Demographics, PatientData, MedicalSummary, ResearchAnalysis, AnalysisReport
 from src.utils.quality_assurance import QualityLevel
 from src.utils.hallucination_prevention import HallucinationRiskLevel
 from src.utils.audit_logger import AuditLogger
 
 from tests.fixtures.sample_patient_data import (
-    SAMPLE_PATIENT_XML_GOOD, SAMPLE_PATIENT_XML_COMPLEX, SAMPLE_PATIENT_XML_MINIMAL,
-    SAMPLE_PATIENT_XML_INVALID, EXPECTED_ANALYSIS_RESULTS, PERFORMANCE_BENCHMARKS,
+    SAMPLE_PATIENT_XML_GOOD_BYTES, SAMPLE_PATIENT_XML_COMPLEX_BYTES, SAMPLE_PATIENT_XML_MINIMAL_BYTES,
+    SAMPLE_PATIENT_XML_INVALID_BYTES, EXPECTED_ANALYSIS_RESULTS, PERFORMANCE_BENCHMARKS,
     MEDICAL_ACCURACY_TEST_CASES, ADVERSARIAL_TEST_CASES
 )
 
+# Basic ICD-10 format: a category letter followed by two digits
+# ([^\W\d_] is any Unicode letter, as str.isalpha() accepts)
+ICD10_CODE_PATTERN = re.compile(r'[^\W\d_]\d{2}')
+
+# Sanitized patient names: up to 100 letters, digits, whitespace, apostrophes, hyphens or periods
+SANITIZED_NAME_PATTERN = re.compile(r"(?:[^\W_]|[\s'.\-]){1,100}")
+
+MEDICATION_CASES = [
+    case for case in MEDICAL_ACCURACY_TEST_CASES if case["test_type"] == "medication_appropriateness"
+]
+CODE_VALIDATION_CASES = [
+    case for case in MEDICAL_ACCURACY_TEST_CASES if case["test_type"] == "code_validation"
+]
+DRUG_INTERACTION_CASES = [
+    case for case in MEDICAL_ACCURACY_TEST_CASES if case["test_type"] == "drug_interactions"
+]
+
+
+def serve_patient_xml(s3_client, patient_xml: bytes):
+    """Have the mocked S3 client return the given patient XML payload."""
+    s3_client.get_object.return_value = {
+        'Body': Mock(read=Mock(return_value=patient_xml))
+    }
+
+
+def _case_id(case):
+    """Use the case description as the parametrized test id."""
+    return case["description"]
+
 class TestComprehensiveIntegration:
     """Comprehensive integration tests with real patient data scenarios."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.audit_logger = Mock(spec=AuditLogger)
-        self.workflow = MainWorkflow(
-            audit_logger=self.audit_logger,
-            enable_enhanced_logging=False,
-            timeout_seconds=60
-        )
-    
-    def mock_s3_operations(self, patient_xml: str):
-        """Mock S3 operations to return sample patient data."""
-        # Mock S3 client to return sample XML
-        mock_s3_client = Mock()
-        mock_s3_client.get_object.return_value = {
-            'Body': Mock(read=Mock(return_value=patient_xml.encode('utf-8')))
-        }
-        
-        # Mock S3 operations in XML parser
-        with patch('src.agents.xml_parser_agent.boto3.client', return_value=mock_s3_client):
-            # Mock S3 persistence
-            with patch.object(self.workflow.s3_persister, 'save_analysis_report', return_value="s3://test-bucket/analysis-123.json"):
-                yield mock_s3_client
+    @pytest.fixture(autouse=True)
+    def setup_workflow(self, workflow, patched_boto, mocker):
+        """Bind the shared workflow, reset its audit logger and statistics, and mock S3."""
+        workflow.audit_logger.reset_mock()
+        workflow.clear_statistics()
+        mocker.patch.object(workflow.s3_persister, 'save_analysis_report',
+                            return_value="s3://test-bucket/analysis-123.json")
+        self.audit_logger = workflow.audit_logger
+        self.s3_client = patched_boto
+        self.workflow = workflow
     
     @pytest.mark.asyncio
     async def test_end_to_end_good_patient_data(self):
@@ -55,48 +74,48 @@ class TestComprehensiveIntegration:
         patient_name = "John Doe"
         expected = EXPECTED_ANALYSIS_RESULTS["TEST_P001"]
         
-        with self.mock_s3_operations(SAMPLE_PATIENT_XML_GOOD):
-            start_time = time.time()
-            
-            # Execute complete workflow
-            result = await self.workflow.execute_complete_analysis(patient_name)
-            
-            execution_time = time.time() - start_time
-            
-            # Verify basic result structure
-            assert result is not None
-            assert isinstance(result, AnalysisReport)
-            assert result.patient_data.patient_id == expected["patient_id"]
-            assert result.patient_data.name == expected["name"]
-            assert result.patient_data.age == expected["age"]
-            assert result.patient_data.gender == expected["gender"]
-            
-            # Verify medical summary quality
-            assert result.medical_summary is not None
-            assert len(result.medical_summary.summary_text) > 50
-            assert len(result.medical_summary.key_conditions) >= 2
-            assert len(result.medical_summary.medications) >= 2
-            
-            # Verify research analysis
-            assert result.research_analysis is not None
-            assert result.research_analysis.analysis_confidence > 0.5
-            assert len(result.research_analysis.insights) > 0
-            assert len(result.research_analysis.recommendations) > 0
-            
-            # Verify quality assurance passed
-            assert hasattr(result, 'processing_metadata')
-            assert 'quality_assessment' in result.processing_metadata
-            qa_data = result.processing_metadata['quality_assessment']
-            assert qa_data['quality_level'] in ['excellent', 'good', 'acceptable']
-            assert qa_data['overall_score'] >= expected["quality_expectations"]["min_quality_score"]
-            assert qa_data['hallucination_risk'] <= expected["quality_expectations"]["max_hallucination_risk"]
-            
-            # Verify performance
-            assert execution_time <= PERFORMANCE_BENCHMARKS["total_workflow_max_time"]
-            
-            # Verify audit logging
-            assert self.audit_logger.log_patient_access.called
-            assert self.audit_logger.log_system_event.called
+        serve_patient_xml(self.s3_client, SAMPLE_PATIENT_XML_GOOD_BYTES)
+        start_time = time.time()
+        
+        # Execute complete workflow
+        result = await self.workflow.execute_complete_analysis(patient_name)
+        
+        execution_time = time.time() - start_time
+        
+        # Verify basic result structure
+        assert result is not None
+        assert isinstance(result, AnalysisReport)
+        assert result.patient_data.patient_id == expected["patient_id"]
+        assert result.patient_data.name == expected["name"]
+        assert result.patient_data.age == expected["age"]
+        assert result.patient_data.gender == expected["gender"]
+        
+        # Verify medical summary quality
+        assert result.medical_summary is not None
+        assert len(result.medical_summary.summary_text) > 50
+        assert len(result.medical_summary.key_conditions) >= 2
+        assert len(result.medical_summary.medications) >= 2
+        
+        # Verify research analysis
+        assert result.research_analysis is not None
+        assert result.research_analysis.analysis_confidence > 0.5
+        assert len(result.research_analysis.insights) > 0
+        assert len(result.research_analysis.recommendations) > 0
+        
+        # Verify quality assurance passed
+        assert hasattr(result, 'processing_metadata')
+        assert 'quality_assessment' in result.processing_metadata
+        qa_data = result.processing_metadata['quality_assessment']
+        assert qa_data['quality_level'] in ['excellent', 'good', 'acceptable']
+        assert qa_data['overall_score'] >= expected["quality_expectations"]["min_quality_score"]
+        assert qa_data['hallucination_risk'] <= expected["quality_expectations"]["max_hallucination_risk"]
+        
+        # Verify performance
+        assert execution_time <= PERFORMANCE_BENCHMARKS["total_workflow_max_time"]
+        
+        # Verify audit logging
+        assert self.audit_logger.log_patient_access.called
+        assert self.audit_logger.log_system_event.called
     
     @pytest.mark.asyncio
     async def test_end_to_end_complex_patient_data(self):
@@ -104,38 +123,38 @@ class TestComprehensiveIntegration:
         patient_name = "Jane Smith"
         expected = EXPECTED_ANALYSIS_RESULTS["TEST_P002"]
         
-        with self.mock_s3_operations(SAMPLE_PATIENT_XML_COMPLEX):
-            start_time = time.time()
-            
-            # Execute complete workflow
-            result = await self.workflow.execute_complete_analysis(patient_name)
-            
-            execution_time = time.time() - start_time
-            
-            # Verify complex medical conditions are handled
-            assert result.patient_data.patient_id == expected["patient_id"]
-            assert len(result.medical_summary.key_conditions) >= 3
-            
-            # Verify cancer-related medications are identified
-            medications = [med.lower() if isinstance(med, str) else med.get('name', '').lower() 
-                          for med in result.medical_summary.medications]
-            assert any('tamoxifen' in med for med in medications)
-            
-            # Verify research includes cancer-related topics
-            research_text = ' '.join([
-                result.research_analysis.summary_text or '',
-                ' '.join(result.research_analysis.insights or []),
-                ' '.join(result.research_analysis.recommendations or [])
-            ]).lower()
-            
-            assert any(topic in research_text for topic in expected["expected_research_topics"])
-            
-            # Verify quality for complex case
-            qa_data = result.processing_metadata['quality_assessment']
-            assert qa_data['overall_score'] >= expected["quality_expectations"]["min_quality_score"]
-            
-            # Performance should still be reasonable for complex cases
-            assert execution_time <= PERFORMANCE_BENCHMARKS["total_workflow_max_time"] * 1.5
+        serve_patient_xml(self.s3_client, SAMPLE_PATIENT_XML_COMPLEX_BYTES)
+        start_time = time.time()
+        
+        # Execute complete workflow
+        result = await self.workflow.execute_complete_analysis(patient_name)
+        
+        execution_time = time.time() - start_time
+        
+        # Verify complex medical conditions are handled
+        assert result.patient_data.patient_id == expected["patient_id"]
+        assert len(result.medical_summary.key_conditions) >= 3
+        
+        # Verify cancer-related medications are identified
+        medications = [med.lower() if isinstance(med, str) else med.get('name', '').lower() 
+                      for med in result.medical_summary.medications]
+        assert any('tamoxifen' in med for med in medications)
+        
+        # Verify research includes cancer-related topics
+        research_text = ' '.join([
+            result.research_analysis.summary_text or '',
+            ' '.join(result.research_analysis.insights or []),
+            ' '.join(result.research_analysis.recommendations or [])
+        ]).lower()
+        
+        assert any(topic in research_text for topic in expected["expected_research_topics"])
+        
+        # Verify quality for complex case
+        qa_data = result.processing_metadata['quality_assessment']
+        assert qa_data['overall_score'] >= expected["quality_expectations"]["min_quality_score"]
+        
+        # Performance should still be reasonable for complex cases
+        assert execution_time <= PERFORMANCE_BENCHMARKS["total_workflow_max_time"] * 1.5
     
     @pytest.mark.asyncio
     async def test_end_to_end_minimal_patient_data(self):
@@ -143,44 +162,44 @@ class TestComprehensiveIntegration:
         patient_name = "Bob Johnson"
         expected = EXPECTED_ANALYSIS_RESULTS["TEST_P003"]
         
-        with self.mock_s3_operations(SAMPLE_PATIENT_XML_MINIMAL):
-            # Execute complete workflow
-            result = await self.workflow.execute_complete_analysis(patient_name)
-            
-            # Verify basic functionality with minimal data
-            assert result.patient_data.patient_id == expected["patient_id"]
-            assert len(result.medical_summary.key_conditions) >= 1
-            assert len(result.medical_summary.medications) >= 1
-            
-            # Quality should be acceptable even with minimal data
-            qa_data = result.processing_metadata['quality_assessment']
-            assert qa_data['quality_level'] in ['acceptable', 'good', 'excellent']
-            assert qa_data['overall_score'] >= expected["quality_expectations"]["min_quality_score"]
-            
-            # Should still generate research insights
-            assert result.research_analysis is not None
-            assert len(result.research_analysis.insights) > 0
+        serve_patient_xml(self.s3_client, SAMPLE_PATIENT_XML_MINIMAL_BYTES)
+        # Execute complete workflow
+        result = await self.workflow.execute_complete_analysis(patient_name)
+        
+        # Verify basic functionality with minimal data
+        assert result.patient_data.patient_id == expected["patient_id"]
+        assert len(result.medical_summary.key_conditions) >= 1
+        assert len(result.medical_summary.medications) >= 1
+        
+        # Quality should be acceptable even with minimal data
+        qa_data = result.processing_metadata['quality_assessment']
+        assert qa_data['quality_level'] in ['acceptable', 'good', 'excellent']
+        assert qa_data['overall_score'] >= expected["quality_expectations"]["min_quality_score"]
+        
+        # Should still generate research insights
+        assert result.research_analysis is not None
+        assert len(result.research_analysis.insights) > 0
     
     @pytest.mark.asyncio
     async def test_invalid_patient_data_handling(self):
         """Test workflow handling of invalid patient data."""
         patient_name = "Invalid Patient"
         
-        with self.mock_s3_operations(SAMPLE_PATIENT_XML_INVALID):
-            # Should handle invalid data gracefully or raise appropriate error
-            try:
-                result = await self.workflow.execute_complete_analysis(patient_name)
-                
-                # If it succeeds, quality should be poor
-                qa_data = result.processing_metadata['quality_assessment']
-                assert qa_data['quality_level'] in ['poor', 'unacceptable']
-                assert qa_data['overall_score'] < 0.5
-                
-            except Exception as e:
-                # Should be a specific error type, not a generic exception
-                assert any(error_type in str(type(e)) for error_type in [
-                    'XMLParsingError', 'AgentCommunicationError', 'ReportError'
-                ])
+        serve_patient_xml(self.s3_client, SAMPLE_PATIENT_XML_INVALID_BYTES)
+        # Should handle invalid data gracefully or raise appropriate error
+        try:
+            result = await self.workflow.execute_complete_analysis(patient_name)
+            
+            # If it succeeds, quality should be poor
+            qa_data = result.processing_metadata['quality_assessment']
+            assert qa_data['quality_level'] in ['poor', 'unacceptable']
+            assert qa_data['overall_score'] < 0.5
+            
+        except Exception as e:
+            # Should be a specific error type, not a generic exception
+            assert any(error_type in str(type(e)) for error_type in [
+                'XMLParsingError', 'AgentCommunicationError', 'ReportError'
+            ])
     
     def test_workflow_progress_tracking(self):
         """Test workflow progress tracking functionality."""
@@ -252,23 +271,15 @@ class TestComprehensiveIntegration:
     @pytest.mark.asyncio
     async def test_workflow_timeout_handling(self):
         """Test workflow timeout handling."""
-        # Create workflow with very short timeout
-        short_timeout_workflow = MainWorkflow(
-            audit_logger=self.audit_logger,
-            timeout_seconds=1,  # 1 second timeout
-            enable_enhanced_logging=False
-        )
-        
-        # Mock a slow operation
-        with patch.object(short_timeout_workflow, '_execute_xml_parsing') as mock_xml:
-            mock_xml.side_effect = asyncio.sleep(5)  # Simulate 5-second delay
+        # Raise the timeout immediately instead of sleeping past a real deadline;
+        # _execute_xml_parsing's wait_for propagates it to its timeout handler.
+        with patch.object(self.workflow.xml_parser, 'parse_patient_record',
+                          side_effect=asyncio.TimeoutError()):
+            with pytest.raises(Exception) as exc_info:
+                await self.workflow.execute_complete_analysis("Test Patient")
             
-            with self.mock_s3_operations(SAMPLE_PATIENT_XML_GOOD):
-                with pytest.raises(Exception) as exc_info:
-                    await short_timeout_workflow.execute_complete_analysis("Test Patient")
-                
-                # Should be a timeout-related error
-                assert any(keyword in str(exc_info.value).lower() for keyword in ['timeout', 'timed out'])
+            # Should be a timeout-related error
+            assert any(keyword in str(exc_info.value).lower() for keyword in ['timeout', 'timed out'])
     
     @pytest.mark.asyncio
     async def test_workflow_error_recovery(self):
@@ -284,12 +295,12 @@ class TestComprehensiveIntegration:
             assert self.audit_logger.log_error.called or self.audit_logger.log_system_event.called
         
         # Test recovery from research correlation error
-        with self.mock_s3_operations(SAMPLE_PATIENT_XML_GOOD):
-            with patch.object(self.workflow, '_execute_research_correlation') as mock_research:
-                mock_research.side_effect = Exception("Simulated research error")
-                
-                with pytest.raises(Exception):
-                    await self.workflow.execute_complete_analysis("Test Patient")
+        serve_patient_xml(self.s3_client, SAMPLE_PATIENT_XML_GOOD_BYTES)
+        with patch.object(self.workflow, '_execute_research_correlation') as mock_research:
+            mock_research.side_effect = Exception("Simulated research error")
+            
+            with pytest.raises(Exception):
+                await self.workflow.execute_complete_analysis("Test Patient")
     
     def test_audit_logging_compliance(self):
         """Test HIPAA-compliant audit logging."""
@@ -311,33 +322,71 @@ class TestComprehensiveIntegration:
         
         assert self.workflow.audit_logger.log_patient_access.called
 
+@pytest.fixture(scope="module")
+def sample_analysis_report():
+    """Build the QA benchmark's analysis report once per module."""
+    demographics = Demographics(
+        date_of_birth="1978-01-01",
+        gender="Male",
+        age=45,
+        address=None,
+        phone=None,
+        emergency_contact=None
+    )
+    
+    patient_data = PatientData(
+        name="John Doe",
+        patient_id="TEST_P001",
+        demographics=demographics,
+        medical_history=[],
+        medications=[],
+        procedures=[],
+        diagnoses=[],
+        raw_xml="<patient></patient>",
+        extraction_timestamp=datetime.now()
+    )
+    medical_summary = MedicalSummary(
+        summary_text="Patient has well-controlled diabetes",
+        key_conditions=[{"name": "Diabetes", "confidence_score": 0.9}]
+    )
+    research_analysis = ResearchAnalysis(
+        research_findings=[],
+        analysis_confidence=0.8,
+        insights=["Good diabetes management"],
+        recommendations=["Continue treatment"]
+    )
+    
+    return AnalysisReport(
+        report_id="TEST_R001",
+        patient_data=patient_data,
+        medical_summary=medical_summary,
+        research_analysis=research_analysis,
+        generated_at=datetime.now()
+    )
+
+
 class TestPerformanceBenchmarks:
     """Performance benchmark tests for the medical analysis system."""
     
-    def setup_method(self):
-        """Set up performance test fixtures."""
-        self.workflow = MainWorkflow(enable_enhanced_logging=False)
+    @pytest.fixture(autouse=True)
+    def setup_workflow(self, workflow):
+        """Bind the shared workflow for performance tests."""
+        self.workflow = workflow
     
     @pytest.mark.asyncio
-    async def test_xml_parsing_performance(self):
+    async def test_xml_parsing_performance(self, patched_boto):
         """Test XML parsing performance benchmarks."""
         xml_parser = XMLParserAgent()
         
-        # Mock S3 operations
-        with patch('src.agents.xml_parser_agent.boto3.client') as mock_boto:
-            mock_s3_client = Mock()
-            mock_s3_client.get_object.return_value = {
-                'Body': Mock(read=Mock(return_value=SAMPLE_PATIENT_XML_GOOD.encode('utf-8')))
-            }
-            mock_boto.return_value = mock_s3_client
-            
-            start_time = time.time()
-            result = xml_parser.parse_patient_record("John Doe")
-            execution_time = time.time() - start_time
-            
-            # Verify performance benchmark
-            assert execution_time <= PERFORMANCE_BENCHMARKS["xml_parsing_max_time"]
-            assert result is not None
+        serve_patient_xml(patched_boto, SAMPLE_PATIENT_XML_GOOD_BYTES)
+        
+        start_time = time.time()
+        result = xml_parser.parse_patient_record("John Doe")
+        execution_time = time.time() - start_time
+        
+        # Verify performance benchmark
+        assert execution_time <= PERFORMANCE_BENCHMARKS["xml_parsing_max_time"]
+        assert result is not None
     
     @pytest.mark.asyncio
     async def test_medical_summarization_performance(self):
@@ -389,49 +438,10 @@ class TestPerformanceBenchmarks:
         assert result is not None
     
     @pytest.mark.asyncio
-    async def test_quality_assurance_performance(self):
+    async def test_quality_assurance_performance(self, sample_analysis_report):
         """Test quality assurance performance benchmarks."""
-        from src.models import Demographics
-        
-        # Create sample analysis report
-        demographics = Demographics(
-            date_of_birth="1978-01-01",
-            gender="Male",
-            age=45,
-            address=None,
-            phone=None,
-            emergency_contact=None
-        )
-        
-        patient_data = PatientData(
-            name="John Doe",
-            patient_id="TEST_P001",
-            demographics=demographics,
-            medical_history=[],
-            medications=[],
-            procedures=[],
-            diagnoses=[],
-            raw_xml="<patient></patient>",
-            extraction_timestamp=datetime.now()
-        )
-        medical_summary = MedicalSummary(
-            summary_text="Patient has well-controlled diabetes",
-            key_conditions=[{"name": "Diabetes", "confidence_score": 0.9}]
-        )
-        research_analysis = ResearchAnalysis(
-            research_findings=[],
-            analysis_confidence=0.8,
-            insights=["Good diabetes management"],
-            recommendations=["Continue treatment"]
-        )
-        
-        analysis_report = AnalysisReport(
-            report_id="TEST_R001",
-            patient_data=patient_data,
-            medical_summary=medical_summary,
-            research_analysis=research_analysis,
-            generated_at=datetime.now()
-        )
+        # QA annotates the report, so benchmark a copy built outside the timed region
+        analysis_report = copy.deepcopy(sample_analysis_report)
         
         start_time = time.time()
         qa_result = await self.workflow._execute_quality_assurance(analysis_report)
@@ -444,77 +454,60 @@ class TestPerformanceBenchmarks:
 class TestMedicalAccuracy:
     """Medical accuracy validation tests."""
     
-    def setup_method(self):
-        """Set up medical accuracy test fixtures."""
-        self.workflow = MainWorkflow(enable_enhanced_logging=False)
-    
-    def test_medication_appropriateness_validation(self):
+    @pytest.mark.parametrize("test_case", MEDICATION_CASES, ids=_case_id)
+    def test_medication_appropriateness_validation(self, test_case):
         """Test validation of medication appropriateness for conditions."""
-        for test_case in MEDICAL_ACCURACY_TEST_CASES:
-            if test_case["test_type"] == "medication_appropriateness":
-                condition = test_case["input_condition"]
-                expected_meds = test_case["expected_medications"]
-                invalid_meds = test_case["invalid_medications"]
-                
-                # Test that expected medications are considered appropriate
-                for med in expected_meds:
-                    # This would use a real medical knowledge base in production
-                    # For testing, we verify the structure exists
-                    assert isinstance(med, str)
-                    assert len(med) > 0
-                
-                # Test that invalid medications are flagged
-                for med in invalid_meds:
-                    assert isinstance(med, str)
-                    assert len(med) > 0
+        expected_meds = test_case["expected_medications"]
+        invalid_meds = test_case["invalid_medications"]
+        
+        # Test that expected medications are considered appropriate
+        for med in expected_meds:
+            # This would use a real medical knowledge base in production
+            # For testing, we verify the structure exists
+            assert isinstance(med, str)
+            assert len(med) > 0
+        
+        # Test that invalid medications are flagged
+        for med in invalid_meds:
+            assert isinstance(med, str)
+            assert len(med) > 0
     
-    def test_icd_code_validation(self):
+    @pytest.mark.parametrize("test_case", CODE_VALIDATION_CASES, ids=_case_id)
+    def test_icd_code_validation(self, test_case):
         """Test ICD-10 code format validation."""
-        for test_case in MEDICAL_ACCURACY_TEST_CASES:
-            if test_case["test_type"] == "code_validation":
-                valid_codes = test_case["input_codes"]
-                invalid_codes = test_case["invalid_codes"]
-                
-                # Test valid ICD-10 codes
-                for code in valid_codes:
-                    # Basic ICD-10 format validation
-                    assert len(code) >= 3
-                    assert code[0].isalpha()
-                    assert code[1:3].isdigit()
-                
-                # Test invalid codes
-                for code in invalid_codes:
-                    # These should not match ICD-10 format
-                    is_valid_format = (
-                        len(code) >= 3 and 
-                        code[0].isalpha() and 
-                        code[1:3].isdigit()
-                    )
-                    assert not is_valid_format
+        valid_codes = test_case["input_codes"]
+        invalid_codes = test_case["invalid_codes"]
+        
+        # Test valid ICD-10 codes
+        for code in valid_codes:
+            assert ICD10_CODE_PATTERN.match(code)
+        
+        # Test invalid codes
+        for code in invalid_codes:
+            # These should not match ICD-10 format
+            assert not ICD10_CODE_PATTERN.match(code)
     
-    def test_drug_interaction_awareness(self):
+    @pytest.mark.parametrize("test_case", DRUG_INTERACTION_CASES, ids=_case_id)
+    def test_drug_interaction_awareness(self, test_case):
         """Test awareness of drug interactions."""
-        for test_case in MEDICAL_ACCURACY_TEST_CASES:
-            if test_case["test_type"] == "drug_interactions":
-                combinations = test_case["medication_combinations"]
-                
-                for combo in combinations:
-                    drugs = combo["drugs"]
-                    risk_level = combo["interaction_risk"]
-                    
-                    # Verify structure
-                    assert len(drugs) == 2
-                    assert risk_level in ["low", "moderate", "high"]
-                    
-                    # In production, this would check against drug interaction database
-                    assert all(isinstance(drug, str) for drug in drugs)
+        for combo in test_case["medication_combinations"]:
+            drugs = combo["drugs"]
+            risk_level = combo["interaction_risk"]
+            
+            # Verify structure
+            assert len(drugs) == 2
+            assert risk_level in ["low", "moderate", "high"]
+            
+            # In production, this would check against drug interaction database
+            assert all(isinstance(drug, str) for drug in drugs)
 
 class TestAdversarialScenarios:
     """Adversarial testing for hallucination detection and security."""
     
-    def setup_method(self):
-        """Set up adversarial test fixtures."""
-        self.workflow = MainWorkflow(enable_enhanced_logging=False)
+    @pytest.fixture(autouse=True)
+    def setup_workflow(self, workflow):
+        """Bind the shared workflow for adversarial tests."""
+        self.workflow = workflow
     
     def test_hallucination_detection(self):
         """Test detection of AI hallucinations in medical content."""
@@ -562,14 +555,13 @@ class TestAdversarialScenarios:
                 
                 # If validation passes, result should be sanitized
                 if validated_name:
-                    assert len(validated_name) <= 100
-                    assert all(c.isalnum() or c.isspace() or c in "'-." for c in validated_name)
+                    assert SANITIZED_NAME_PATTERN.fullmatch(validated_name)
                     
             except Exception as e:
                 # Should raise appropriate validation error, not crash
                 assert "validation" in str(e).lower() or "invalid" in str(e).lower()
     
-    def test_xml_injection_protection(self):
+    def test_xml_injection_protection(self, patched_boto):
         """Test protection against XML injection attacks."""
         malicious_xml = """<?xml version="1.0" encoding="UTF-8"?>
         <!DOCTYPE patient_record [
@@ -585,24 +577,19 @@ class TestAdversarialScenarios:
         # Test that XML parser handles malicious XML safely
         xml_parser = XMLParserAgent()
         
-        with patch('src.agents.xml_parser_agent.boto3.client') as mock_boto:
-            mock_s3_client = Mock()
-            mock_s3_client.get_object.return_value = {
-                'Body': Mock(read=Mock(return_value=malicious_xml.encode('utf-8')))
-            }
-            mock_boto.return_value = mock_s3_client
+        serve_patient_xml(patched_boto, malicious_xml.encode('utf-8'))
+        
+        try:
+            result = xml_parser.parse_patient_record("Malicious Patient")
             
-            try:
-                result = xml_parser.parse_patient_record("Malicious Patient")
+            # If parsing succeeds, should not contain malicious content
+            if result:
+                assert "file:///etc/passwd" not in str(result.__dict__)
+                assert "&xxe;" not in str(result.__dict__)
                 
-                # If parsing succeeds, should not contain malicious content
-                if result:
-                    assert "file:///etc/passwd" not in str(result.__dict__)
-                    assert "&xxe;" not in str(result.__dict__)
-                    
-            except Exception as e:
-                # Should handle malicious XML gracefully
-                assert not isinstance(e, SystemExit)  # Should not crash the system
+        except Exception as e:
+            # Should handle malicious XML gracefully
+            assert not isinstance(e, SystemExit)  # Should not crash the system
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -357,7 +357,7 @@ class TestHallucinationPreventionSystem:
         
         assert result.risk_level == HallucinationRiskLevel.MINIMAL
         assert not result.requires_human_review
-        assert self.system.prevention_stats["total_checks"] == 1
+        assert self.system.get_prevention_statistics()["total_checks"] == 1
     
     def test_check_content_high_risk(self):
         """Test checking high-risk content."""
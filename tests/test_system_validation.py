@@ -8,7 +8,7 @@ from src.workflow.main_workflow import MainWorkflow
 from src.utils.quality_assurance import QualityLevel
 from src.utils.hallucination_prevention import HallucinationRiskLevel
 from src.models import PatientData, MedicalSummary, ResearchAnalysis, AnalysisReport
-from tests.fixtures.sample_patient_data import SAMPLE_PATIENT_XML_GOOD, EXPECTED_ANALYSIS_RESULTS
+from tests.fixtures.sample_patient_data import SAMPLE_PATIENT_XML_GOOD_BYTES, EXPECTED_ANALYSIS_RESULTS
 
 class TestSystemValidation:
     """System validation tests."""
@@ -23,7 +23,7 @@ class TestSystemValidation:
         with patch('src.agents.xml_parser_agent.boto3.client') as mock_boto:
             mock_s3_client = Mock()
             mock_s3_client.get_object.return_value = {
-                'Body': Mock(read=Mock(return_value=SAMPLE_PATIENT_XML_GOOD.encode('utf-8')))
+                'Body': Mock(read=Mock(return_value=SAMPLE_PATIENT_XML_GOOD_BYTES))
             }
             mock_boto.return_value = mock_s3_client
             